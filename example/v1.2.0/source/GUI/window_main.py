@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'window_main.ui'
+#
+# Created by: PyQt5 UI code generator 5.12.3
+#
+# WARNING! All changes made in this file will be lost!
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(400, 91)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(400, 0))
+        MainWindow.setSizeIncrement(QtCore.QSize(0, 0))
+        MainWindow.setBaseSize(QtCore.QSize(0, 0))
+        MainWindow.setWindowTitle("certificate_tool")
+        MainWindow.setIconSize(QtCore.QSize(50, 50))
+        MainWindow.setToolButtonStyle(QtCore.Qt.ToolButtonIconOnly)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.centralwidget.setBaseSize(QtCore.QSize(2, 0))
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setSizeConstraint(QtWidgets.QLayout.SetMaximumSize)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.stop_button = QtWidgets.QPushButton(self.centralwidget)
+        self.stop_button.setText("Stop animation")
+        self.stop_button.setObjectName("stop_button")
+        self.horizontalLayout.addWidget(self.stop_button)
+        self.start_button = QtWidgets.QPushButton(self.centralwidget)
+        self.start_button.setText("Start animation")
+        self.start_button.setObjectName("start_button")
+        self.horizontalLayout.addWidget(self.start_button)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+        self.animationTypeSelect_comboBox = QtWidgets.QComboBox(self.centralwidget)
+        self.animationTypeSelect_comboBox.setCurrentText("")
+        self.animationTypeSelect_comboBox.setObjectName("animationTypeSelect_comboBox")
+        self.verticalLayout_2.addWidget(self.animationTypeSelect_comboBox)
+        self.verticalLayout.addLayout(self.verticalLayout_2)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        self.animationTypeSelect_comboBox.setCurrentIndex(-1)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        pass
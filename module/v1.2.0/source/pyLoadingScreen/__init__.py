@@ -0,0 +1,9 @@
+try:
+    import PyQt5
+except ImportError: # without PyQt5 only terminal loading screen (pyLoadingScreen.terminal) is available
+    PyQt5 = None
+
+if PyQt5 is not None:
+    from pyLoadingScreen.pyLoadingScreen import LoadingScreen
+    from pyLoadingScreen.exporter import exportAnimation, exportSpriteSheet
+    from pyLoadingScreen.runner import loading_screen
@@ -0,0 +1,481 @@
+from array import array
+from time import perf_counter
+from fractions import Fraction
+from math import sin, cos, acos, degrees, radians, gcd, pi
+
+from pyLoadingScreen import kernels
+
+
+# point record: x, y, r, g, b, size
+# line record: x1, y1, x2, y2, r, g, b, width, gradient, gradientReverse
+# -1 in color, size or width - default value (animation color and line width)
+POINT_RECORD_SIZE = 6
+LINE_RECORD_SIZE = 10
+
+GRADIENT_NONE = 0
+GRADIENT_LINEAR = 1 # QLinearGradient from line color to background color
+
+DEFAULT_PARAMS = {
+    'detailСoefficient': 20,
+    'color': (255, 0, 0),
+    'colorRainbow': True,
+    'colorRainbowStep': 2,
+    'colorRainbowMinValues': (0, 0, 0),
+    'colorRainbowMaxValues': (255, 255, 255),
+    'lineWidth': 3,
+    'scale': 0.95,
+    'countStepsPerRound': 1440
+}
+
+
+
+class FrameBuffer:
+    """ Frame of animation - flat arrays of point and line records (see POINT_RECORD_SIZE, LINE_RECORD_SIZE).
+
+        points and lines may be any float sequences, that support slicing: array, memoryview (of memory-mapped file) and etc.
+    """
+    def __init__(self, points: object = None, lines: object = None):
+        """INIT."""
+        self.points = points if points is not None else array('d')
+        self.lines = lines if lines is not None else array('d')
+
+
+    @property
+    def pointsCount(self):
+        return len(self.points) // POINT_RECORD_SIZE
+
+
+    @property
+    def linesCount(self):
+        return len(self.lines) // LINE_RECORD_SIZE
+
+
+    def addPoint(self, x: float, y: float, color: tuple = (-1, -1, -1), size: float = -1):
+        """Add point record."""
+        self.points.extend((x, y, color[0], color[1], color[2], size))
+
+
+    def addLine(self, x1: float, y1: float, x2: float, y2: float, color: tuple = (-1, -1, -1), width: float = -1,
+            gradient: int = GRADIENT_NONE, gradientReverse: bool = False):
+        """Add line record."""
+        self.lines.extend((x1, y1, x2, y2, color[0], color[1], color[2], width, gradient, gradientReverse))
+
+
+    def bounds(self, defaultWidth: float):
+        """Bounding box of frame (left, top, right, bottom) and max pen width, or None for empty frame."""
+        points = self.points
+        lines = self.lines
+        xs = list(points[0::POINT_RECORD_SIZE]) + list(lines[0::LINE_RECORD_SIZE]) + list(lines[2::LINE_RECORD_SIZE])
+        if not xs:
+            return None
+        ys = list(points[1::POINT_RECORD_SIZE]) + list(lines[1::LINE_RECORD_SIZE]) + list(lines[3::LINE_RECORD_SIZE])
+        width = max(defaultWidth, max(points[5::POINT_RECORD_SIZE], default=-1), max(lines[7::LINE_RECORD_SIZE], default=-1))
+        return (min(xs), min(ys), max(xs), max(ys)), width
+
+
+
+class Animation:
+    """ Registered animation type.
+
+        layout(width, height, params) -> dict - all values, that not depends on animation phase (cached per widget size and params)
+        frame(phase, layout) -> FrameBuffer - frame for animation step 'phase' (int, from 0)
+        period(layout) -> int or None - count of steps in cycle of periodic animation (None - animation is not periodic)
+        progress(frame, progress, layout) -> FrameBuffer - frame of determinate mode, progress - float from 0 to 1
+            (new frame is returned - frame of animation can be view of frame cache and must not be changed)
+    """
+    def __init__(self, name: str, layout: object, frame: object, period: object = None, progress: object = None):
+        """INIT."""
+        self.name = name
+        self.layout = layout
+        self.frame = frame
+        self._period = period
+        self._progress = progress
+
+
+    def period(self, layout: dict):
+        """Count of steps in animation cycle, or None - if animation is not periodic."""
+        if self._period is None:
+            return None
+        return self._period(layout)
+
+
+    def progressFrame(self, frame: FrameBuffer, progress: float, layout: dict):
+        """Frame with progress drawn. If animation has no determinate mode - frame is returned as is."""
+        if self._progress is None:
+            return frame
+        return self._progress(frame, min(max(progress, 0), 1), layout)
+
+
+
+_animations = {}
+
+
+def registerAnimation(name: str, layout: object, frame: object, period: object = None, progress: object = None):
+    """ Register animation type, available by name (case insensitive) as LoadingScreen 'animationType' param.
+
+        Periodic animations (period is set) get disk frame cache, export and time-based playback as built-in animations.
+        Animations with progress function get determinate mode (LoadingScreen.setProgress).
+        See Animation for functions contract.
+    """
+    animation = Animation(name, layout, frame, period, progress)
+    _animations[name.upper()] = animation
+    return animation
+
+
+def getAnimation(name: str):
+    """Registered animation by name (case insensitive). If animation is not registered - "RoundRobin" is returned."""
+    return _animations.get(name.upper(), _animations['ROUNDROBIN'])
+
+
+def animationsNames():
+    """Names of registered animations."""
+    return [animation.name for animation in _animations.values()]
+
+
+def benchmarkAnimation(name: str, windowSize: tuple = (350, 350), framesCount: int = 1000, **params):
+    """ Benchmark of registered animation without painting. Params - see DEFAULT_PARAMS.
+
+        Returns dict: 'layout' - layout build time, 'frame' - average frame time (seconds), 'period'.
+    """
+    animation = getAnimation(name)
+    animationParams = dict(DEFAULT_PARAMS, **params)
+
+    startTime = perf_counter()
+    layout = animation.layout(windowSize[0], windowSize[1], animationParams)
+    layoutTime = perf_counter() - startTime
+
+    startTime = perf_counter()
+    for phase in range(framesCount):
+        animation.frame(phase, layout)
+    frameTime = (perf_counter() - startTime) / framesCount
+
+    return {'layout': layoutTime, 'frame': frameTime, 'period': animation.period(layout)}
+
+
+def colorRainbowGenerator(colorRainbowStep: int, colorRainbowMinValues: tuple, colorRainbowMaxValues: tuple, oneRound: bool = False):
+    """Generating color for color rainbow."""
+    currentColor = list(colorRainbowMinValues)
+
+    stepsCount = round(3570 / colorRainbowStep)
+    stepsByTask = round(stepsCount / 15) # 15 - count of tasks
+    while True:
+        for idxStep in range(stepsCount):
+            taskId = int(idxStep / stepsByTask)
+
+            if taskId == 0: # 0th task
+                currentColor[0] += colorRainbowStep
+            elif taskId == 1: # 1th task
+                currentColor[1] += colorRainbowStep
+            elif taskId == 2: # 2th task
+                currentColor[0] -= colorRainbowStep
+            elif taskId == 3: # 3th task
+                currentColor[2] += colorRainbowStep
+            elif taskId == 4: # 4th task
+                currentColor[1] -= colorRainbowStep
+            elif taskId == 5: # 5th task
+                currentColor[0] += colorRainbowStep
+            elif taskId == 6: # 6th task
+                currentColor[1] += colorRainbowStep
+
+            elif taskId == 7: # 7th task
+                currentColor[2] -= colorRainbowStep
+            elif taskId == 8: # 8th task
+                currentColor[0] -= colorRainbowStep
+                currentColor[2] += colorRainbowStep
+            elif taskId == 9: # 9th task
+                currentColor[1] -= colorRainbowStep
+                currentColor[0] += colorRainbowStep
+            elif taskId == 10: # 10th task
+                currentColor[2] -= colorRainbowStep
+            elif taskId == 11: # 11th task
+                currentColor[0] -= colorRainbowStep
+                currentColor[1] += colorRainbowStep
+            elif taskId == 12: # 12th task
+                currentColor[1] -= colorRainbowStep
+                currentColor[2] += colorRainbowStep
+            elif taskId == 13: # 13th task
+                currentColor[0] += colorRainbowStep
+                currentColor[1] += colorRainbowStep
+            elif taskId == 14: # 14th task
+                currentColor[0] -= colorRainbowStep
+                currentColor[1] -= colorRainbowStep
+                currentColor[2] -= colorRainbowStep
+
+            for idx in range(3):
+                if currentColor[idx] < colorRainbowMinValues[idx]:
+                    currentColor[idx] = colorRainbowMinValues[idx]
+                elif currentColor[idx] > colorRainbowMaxValues[idx]:
+                    currentColor[idx] = colorRainbowMaxValues[idx]
+
+            yield currentColor
+
+        else:
+            if oneRound:
+                return
+
+
+
+########################################## RoundRobin
+
+def _layout_RoundRobin(width: float, height: float, params: dict):
+    """Round Robin type animation layout."""
+    detailСoefficient = params['detailСoefficient']
+    center = (width / 2, height / 2)
+    angleStep = 360 / detailСoefficient
+    radiusOuter = min(center) * params['scale']
+    radiusInner = radiusOuter / 2
+
+    # angle triggers
+    angleTriggerStep = (degrees(acos(((radiusInner**2 - ((2*radiusInner*sin(radians(180/detailСoefficient)))/2)**2) ** 0.5) / radiusOuter)) + 360/detailСoefficient/2) / 2
+
+    layout = {
+        'center': center,
+        'angleStep': angleStep,
+        'radiusOuter': radiusOuter,
+        'radiusInner': radiusInner,
+        'angleTriggerLeft1': 360 - angleTriggerStep,
+        'angleTriggerRight1': angleTriggerStep,
+        'angleTriggerLeft2': 180 - angleTriggerStep,
+        'angleTriggerRight2': 180 + angleTriggerStep,
+        'dotAngles': [radians(angleStep * idx) for idx in range(detailСoefficient)],
+        # lines: outer, inner and connecting for every dot
+        'linesDots': [(idx, (idx + 1) % detailСoefficient, -idx % detailСoefficient) for idx in range(detailСoefficient)],
+        'countStepsPerRound': params['countStepsPerRound'],
+        'roundStep': 360 / params['countStepsPerRound'],
+        # lines records without coordinates
+        'linesTemplate': array('d', (0, 0, 0, 0, -1, -1, -1, -1, GRADIENT_NONE, 0) * (3 * detailСoefficient)),
+        # determinate mode: arc between outer ring and border, from top clockwise
+        'progressRadius': (radiusOuter + min(center)) / 2,
+        'progressSegmentsCount': 120
+    }
+    layout['kernels'] = kernels.useKernels(detailСoefficient)
+    return layout
+
+
+def _frame_RoundRobin(phase: int, layout: dict):
+    """Round Robin type animation frame."""
+    currentAngle = (phase % layout['countStepsPerRound']) * layout['roundStep']
+    centerX, centerY = layout['center']
+    angleStep = layout['angleStep']
+
+    # radius modulation is same for all dots of frame
+    radiusCoef = 0
+    if currentAngle >= layout['angleTriggerLeft1']: # outer decrease, inner increase
+        radiusCoef = (currentAngle - layout['angleTriggerLeft1']) / angleStep
+    elif currentAngle <= layout['angleTriggerRight1']: # outer increase, inner decrease
+        radiusCoef = (layout['angleTriggerRight1'] - currentAngle) / angleStep
+
+    elif currentAngle >= layout['angleTriggerLeft2'] and currentAngle <= 180: # outer decrease, inner increase
+        radiusCoef = (currentAngle - layout['angleTriggerLeft2']) / angleStep
+    elif currentAngle <= layout['angleTriggerRight2'] and currentAngle >= 180: # outer increase, inner decrease
+        radiusCoef = (layout['angleTriggerRight2'] - currentAngle) / angleStep
+
+    radiusOuter = layout['radiusOuter'] - layout['radiusOuter'] * radiusCoef
+    radiusInner = layout['radiusInner'] + layout['radiusInner'] * radiusCoef
+
+    # outer dots rotate forward, inner dots - backward, so inner dot is reflection of outer
+    currentAngleRadians = radians(currentAngle)
+    if layout['kernels'] and kernels.ready:
+        lines = array('d', layout['linesTemplate'])
+        kernels.roundRobinLines(lines, layout, centerX, centerY, radiusOuter, radiusInner, currentAngleRadians)
+        return FrameBuffer(lines=lines)
+
+    cosDots = [cos(currentAngleRadians + dotAngle) for dotAngle in layout['dotAngles']]
+    sinDots = [sin(currentAngleRadians + dotAngle) for dotAngle in layout['dotAngles']]
+    outerX = [centerX + cosDot * radiusOuter for cosDot in cosDots]
+    outerY = [centerY + sinDot * radiusOuter for sinDot in sinDots]
+    innerX = [centerX + cosDot * radiusInner for cosDot in cosDots]
+    innerY = [centerY - sinDot * radiusInner for sinDot in sinDots]
+
+    lines = array('d')
+    for idx, nextIdx, connectingIdx in layout['linesDots']:
+        lines.extend((
+            outerX[idx], outerY[idx], outerX[nextIdx], outerY[nextIdx], -1, -1, -1, -1, GRADIENT_NONE, 0, # outer line
+            innerX[idx], innerY[idx], innerX[nextIdx], innerY[nextIdx], -1, -1, -1, -1, GRADIENT_NONE, 0, # inner line
+            outerX[idx], outerY[idx], innerX[connectingIdx], innerY[connectingIdx], -1, -1, -1, -1, GRADIENT_NONE, 0 # connecting line
+            ))
+
+    return FrameBuffer(lines=lines)
+
+
+def _period_RoundRobin(layout: dict):
+    """Round Robin type animation cycle - one round."""
+    return layout['countStepsPerRound']
+
+
+def _progress_RoundRobin(frame: FrameBuffer, progress: float, layout: dict):
+    """Round Robin type animation determinate mode - outer ring is filled by progress arc."""
+    centerX, centerY = layout['center']
+    radius = layout['progressRadius']
+    segmentsCount = layout['progressSegmentsCount']
+    segmentAngle = 2 * pi / segmentsCount
+
+    lines = array('d', frame.lines)
+    angle = -pi / 2
+    x1, y1 = centerX, centerY - radius
+    filledSegments = progress * segmentsCount
+    while filledSegments > 0:
+        angle += segmentAngle * min(filledSegments, 1)
+        x2, y2 = centerX + cos(angle) * radius, centerY + sin(angle) * radius
+        lines.extend((x1, y1, x2, y2, -1, -1, -1, -1, GRADIENT_NONE, 0))
+        x1, y1 = x2, y2
+        filledSegments -= 1
+
+    return FrameBuffer(array('d', frame.points), lines)
+
+
+registerAnimation("RoundRobin", _layout_RoundRobin, _frame_RoundRobin, _period_RoundRobin, _progress_RoundRobin)
+
+
+
+########################################## RibbonDance
+
+def _layout_RibbonDance(width: float, height: float, params: dict):
+    """RibbonDance type animation layout."""
+    detailСoefficient = params['detailСoefficient']
+    countStepsPerRound = params['countStepsPerRound']
+    center = (width / 2, height / 2)
+
+    scaleLocal = (params['scale'] + (1 - params['scale']) / 2)
+    leftMargin = width - width * scaleLocal
+    rightMargin = width * scaleLocal
+    topMargin = height - height * scaleLocal
+    bottomMargin = height * scaleLocal
+
+    workWidth = rightMargin - leftMargin
+    workHight = bottomMargin - topMargin
+
+    sectionsStepX = 100 / detailСoefficient
+    stepRoundX = min(workWidth, workHight)
+
+    sectionsCount = round(workWidth / sectionsStepX)
+
+    # (x, angle offset) of every section
+    sections = []
+    for sectionId in range(sectionsCount):
+        indentX = sectionId * sectionsStepX + 2
+        sections.append((leftMargin + indentX, 360 * (indentX / stepRoundX)))
+
+    # colors - (color, inverted color)
+    if params['colorRainbow']:
+        colorVector = [tuple(color) for color in colorRainbowGenerator(params['colorRainbowStep'],
+            params['colorRainbowMinValues'], params['colorRainbowMaxValues'], oneRound=True)]
+    else:
+        colorVector = [tuple(params['color'])]
+    colorVector = [(color, (255 - color[0], 255 - color[1], 255 - color[2])) for color in colorVector]
+
+    # color shift by step: (360 / countStepsPerRound) / sectionsStepX, as integer fraction - to keep it periodic
+    colorShiftNumerator = 360 * detailСoefficient
+    colorShiftDenominator = 100 * countStepsPerRound
+
+    layout = {
+        'center': center,
+        'workHight': workHight,
+        'sections': sections,
+        'colorVector': colorVector,
+        'colorShiftNumerator': colorShiftNumerator,
+        'colorShiftDenominator': colorShiftDenominator,
+        'countStepsPerRound': countStepsPerRound,
+        'angleStep': 360 / countStepsPerRound
+    }
+    layout['kernels'] = kernels.useKernels(detailСoefficient)
+    return layout
+
+
+def _frame_RibbonDance(phase: int, layout: dict):
+    """RibbonDance type animation frame."""
+    currentAngle = (phase % layout['countStepsPerRound']) * layout['angleStep']
+    colorVector = layout['colorVector']
+    colorsCount = len(colorVector)
+    colorShift = int(((phase * layout['colorShiftNumerator']) % (colorsCount * layout['colorShiftDenominator'])) // layout['colorShiftDenominator'])
+
+    centerY = layout['center'][1]
+    halfHight = layout['workHight'] / 2
+    quarterHight = layout['workHight'] / 4
+
+    if layout['kernels'] and kernels.ready:
+        sectionsCount = len(layout['sections'])
+        points = array('d', bytes(8 * POINT_RECORD_SIZE * 2 * sectionsCount))
+        lines = array('d', bytes(8 * LINE_RECORD_SIZE * 2 * sectionsCount))
+        kernels.ribbonDanceFrame(points, lines, layout, colorShift, currentAngle, centerY, halfHight, quarterHight)
+        return FrameBuffer(points, lines)
+
+    points = array('d')
+    lines = array('d')
+    for sectionId, (x, angleOffset) in enumerate(layout['sections']):
+        # trigonometry calculations
+        angleY = angleOffset + currentAngle
+        trigonometryCoef = sin(radians(angleY))
+        indentY = trigonometryCoef * halfHight
+
+        # Y-1, points Y
+        if (angleY % 360) / 180 > 1:
+            y11 = centerY + indentY + 7
+            y21 = centerY - indentY - 7
+            pointY1 = y11 - 5
+            pointY2 = y21 + 5
+        else:
+            y11 = centerY + indentY - 7
+            y21 = centerY - indentY + 7
+            pointY1 = y11 + 5
+            pointY2 = y21 - 5
+
+        # Y-2
+        y12 = y11 - trigonometryCoef * quarterHight
+        y22 = y21 + trigonometryCoef * quarterHight
+
+        # color
+        color1, color2 = colorVector[(sectionId + colorShift) % colorsCount]
+
+        points.extend((
+            x, pointY1, color2[0], color2[1], color2[2], 4,
+            x, pointY2, color1[0], color1[1], color1[2], 4
+            ))
+        lines.extend((
+            x, y11, x, y12, color1[0], color1[1], color1[2], -1, GRADIENT_LINEAR, 1,
+            x, y21, x, y22, color2[0], color2[1], color2[2], -1, GRADIENT_LINEAR, 1
+            ))
+
+    return FrameBuffer(points, lines)
+
+
+def _period_RibbonDance(layout: dict):
+    """RibbonDance type animation cycle - least common multiple of round and colors cycle (if colors cycle is integer)."""
+    countStepsPerRound = layout['countStepsPerRound']
+    colorsCount = len(layout['colorVector'])
+    if colorsCount == 1:
+        return countStepsPerRound
+
+    colorsCycle = Fraction(colorsCount * layout['colorShiftDenominator']) / Fraction(layout['colorShiftNumerator'])
+    if colorsCycle.denominator != 1 or int(countStepsPerRound) != countStepsPerRound:
+        return None
+    countStepsPerRound = int(countStepsPerRound)
+    return countStepsPerRound * colorsCycle.numerator // gcd(countStepsPerRound, colorsCycle.numerator)
+
+
+def _progress_RibbonDance(frame: FrameBuffer, progress: float, layout: dict):
+    """RibbonDance type animation determinate mode - sections light up from left to right, other sections are dimmed."""
+    points = array('d', frame.points)
+    lines = array('d', frame.lines)
+    dimmedBrightness = 0.25
+
+    # every section - 2 points and 2 lines
+    litSections = progress * len(layout['sections'])
+    for sectionId in range(frame.pointsCount // 2):
+        brightness = min(max(litSections - sectionId, 0), 1)
+        if brightness == 1:
+            continue
+        brightness = dimmedBrightness + (1 - dimmedBrightness) * brightness
+
+        # color offset: x, y, r, g, b in point record and x1, y1, x2, y2, r, g, b in line record
+        for records, recordSize, colorOffset in ((points, POINT_RECORD_SIZE, 2), (lines, LINE_RECORD_SIZE, 4)):
+            for recordId in (2 * sectionId, 2 * sectionId + 1):
+                offset = recordId * recordSize + colorOffset
+                records[offset] *= brightness
+                records[offset + 1] *= brightness
+                records[offset + 2] *= brightness
+
+    return FrameBuffer(points, lines)
+
+
+registerAnimation("RibbonDance", _layout_RibbonDance, _frame_RibbonDance, _period_RibbonDance, _progress_RibbonDance)
@@ -0,0 +1,218 @@
+import os
+import sys
+import asyncio
+import argparse
+import tempfile
+from time import perf_counter, sleep
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5 import QtCore
+
+from pyLoadingScreen.pyLoadingScreen import LoadingScreen
+from pyLoadingScreen.exporter import _qApplication
+
+
+DRIVERS = ("none", "none_async", "worker", "worker_async")
+# driver without loading screen, with the same waiting for workload - slowdown of driver is measured against it
+BASELINE_DRIVERS = {'worker': "none", 'worker_async': "none_async"}
+ANIMATION_TYPES = ("RoundRobin", "RibbonDance")
+
+_temporaryFiles = {} # files of workloads, removed after benchmark
+
+
+
+########################################## workloads
+
+def _workloadCpu(size: float):
+    """Pure python CPU-bound loop (holds GIL all time)."""
+    startTime = perf_counter()
+    total = 0
+    for idx in range(int(3000000 * size)):
+        total += idx * idx % 7
+    return perf_counter() - startTime
+
+
+def _workloadNumpy(size: float):
+    """NumPy sorting (GIL is released inside NumPy)."""
+    import numpy
+
+    data = numpy.random.default_rng(0).random(1000000)
+    startTime = perf_counter()
+    for _ in range(max(1, int(10 * size))):
+        numpy.sort(data)
+    return perf_counter() - startTime
+
+
+def _workloadFiles(size: float):
+    """Reading of file by 1 MB blocks (I/O, GIL is released while reading)."""
+    fileName = _temporaryFiles.get('files')
+    if fileName is None:
+        fileDescriptor, fileName = tempfile.mkstemp(prefix="pyLoadingScreenBenchmark")
+        with os.fdopen(fileDescriptor, 'wb') as file:
+            for _ in range(64):
+                file.write(os.urandom(1 << 20))
+        _temporaryFiles['files'] = fileName
+
+    startTime = perf_counter()
+    for _ in range(max(1, int(8 * size))):
+        with open(fileName, 'rb', buffering=0) as file:
+            while file.read(1 << 20):
+                pass
+    return perf_counter() - startTime
+
+
+WORKLOADS = {
+    'cpu': _workloadCpu,
+    'numpy': _workloadNumpy,
+    'files': _workloadFiles,
+}
+
+
+
+########################################## drivers
+
+def _runNone(workload: object, size: float, screenParams: dict):
+    """Workload in thread pool, GUI thread waits in event loop - without loading screen."""
+    with ThreadPoolExecutor(1) as executor:
+        future = executor.submit(workload, size)
+        eventLoop = QtCore.QEventLoop()
+        future.add_done_callback(lambda _: QtCore.QMetaObject.invokeMethod(eventLoop, "quit", QtCore.Qt.QueuedConnection))
+        if not future.done():
+            eventLoop.exec_()
+        return future.result()
+
+
+def _runWorker(workload: object, size: float, screenParams: dict):
+    """Workload in thread pool, loading screen 'worker' in thread."""
+    with LoadingScreen.run(**screenParams) as runner:
+        return runner.call(workload, size)
+
+
+def _runAsync(workload: object, size: float, screenParams: dict = None):
+    """ Workload in executor of asyncio loop, loading screen 'worker_async' at the same loop (None screenParams - without it).
+
+        Qt events are processed by task of loop (as with Qt / asyncio integration loops).
+    """
+    app = _qApplication()
+
+    async def processEvents():
+        while True:
+            app.processEvents()
+            await asyncio.sleep(0.005)
+
+    async def run():
+        eventsTask = asyncio.ensure_future(processEvents())
+        try:
+            if screenParams is None:
+                return await asyncio.get_running_loop().run_in_executor(None, workload, size)
+            async with LoadingScreen.run(**screenParams):
+                return await asyncio.get_running_loop().run_in_executor(None, workload, size)
+        finally:
+            eventsTask.cancel()
+
+    return asyncio.run(run())
+
+
+def _runNoneAsync(workload: object, size: float, screenParams: dict):
+    """Workload in executor of asyncio loop, that processes Qt events - without loading screen."""
+    return _runAsync(workload, size)
+
+
+def _runWorkerAsync(workload: object, size: float, screenParams: dict):
+    """Workload in executor of asyncio loop, loading screen 'worker_async' at the same loop."""
+    return _runAsync(workload, size, screenParams)
+
+
+_drivers = {
+    'none': _runNone,
+    'none_async': _runNoneAsync,
+    'worker': _runWorker,
+    'worker_async': _runWorkerAsync,
+}
+
+
+
+def benchmarkInterference(workloads: tuple = None, drivers: tuple = DRIVERS, animationTypes: tuple = ANIMATION_TYPES,
+        repeats: int = 3, size: float = 1.0, **screenParams):
+    """ Slowdown of background workloads by loading screen (GIL contention, wakeups of worker, signals and painting).
+
+        Every workload (see WORKLOADS) is run without loading screen by baseline drivers (see BASELINE_DRIVERS: "none" - in
+        Qt event loop, "none_async" - in asyncio loop with processing of Qt events), then with every driver and animation type.
+        Workload time is measured inside workload, best of 'repeats' runs is taken.
+        screenParams - LoadingScreen params for all runs.
+
+        Returns list of dicts: 'workload', 'driver', 'animationType', 'time' (seconds), 'slowdown' (percent of time
+        of baseline driver, 0 for baseline drivers).
+    """
+    app = _qApplication() # keep reference while running
+    if workloads is None:
+        workloads = [name for name in WORKLOADS if name != 'numpy' or _isNumpyAvailable()]
+
+    results = []
+    try:
+        _benchmarkWorkloads(results, workloads, drivers, animationTypes, repeats, size, screenParams)
+    finally:
+        for fileName in _temporaryFiles.values():
+            os.remove(fileName)
+        _temporaryFiles.clear()
+    return results
+
+
+def _benchmarkWorkloads(results: list, workloads: tuple, drivers: tuple, animationTypes: tuple, repeats: int, size: float, screenParams: dict):
+    """Run benchmarkInterference workloads, results are appended to 'results'."""
+    for workloadName in workloads:
+        workload = WORKLOADS[workloadName]
+        workload(size / 10) # warm up (caches, imports)
+
+        baseTimes = {}
+        for driver in DRIVERS:
+            if driver in BASELINE_DRIVERS.values() and (driver in drivers or driver in map(BASELINE_DRIVERS.get, drivers)):
+                baseTimes[driver] = min(_drivers[driver](workload, size, screenParams) for _ in range(repeats))
+                results.append({'workload': workloadName, 'driver': driver, 'animationType': None, 'time': baseTimes[driver], 'slowdown': 0.0})
+
+        for driver in drivers:
+            if driver not in BASELINE_DRIVERS:
+                continue
+            baseTime = baseTimes[BASELINE_DRIVERS[driver]]
+            for animationType in animationTypes:
+                params = dict(screenParams, animationType=animationType)
+                driverTime = min(_drivers[driver](workload, size, params) for _ in range(repeats))
+                results.append({'workload': workloadName, 'driver': driver, 'animationType': animationType,
+                    'time': driverTime, 'slowdown': (driverTime / baseTime - 1) * 100})
+                sleep(0.1) # let closed loading screen be deleted
+
+
+def _isNumpyAvailable():
+    try:
+        import numpy
+    except ImportError:
+        return False
+    return True
+
+
+def formatResults(results: list):
+    """Results of benchmarkInterference as text table."""
+    lines = ["{:<8} {:<14} {:<13} {:>9} {:>10}".format("workload", "driver", "animation", "time, s", "slowdown")]
+    for result in results:
+        lines.append("{:<8} {:<14} {:<13} {:>9.3f} {:>9.1f}%".format(
+            result['workload'], result['driver'], result['animationType'] or "-", result['time'], result['slowdown']))
+    return "\n".join(lines)
+
+
+
+def main(arguments: list = None):
+    """$ python -m pyLoadingScreen.benchmark [--workloads cpu files] [--drivers worker] [--repeats 3] [--size 1]"""
+    parser = argparse.ArgumentParser(prog="python -m pyLoadingScreen.benchmark", description="Slowdown of background workloads by loading screen")
+    parser.add_argument('--workloads', nargs='+', choices=list(WORKLOADS), default=None)
+    parser.add_argument('--drivers', nargs='+', choices=list(DRIVERS), default=list(DRIVERS))
+    parser.add_argument('--animations', nargs='+', default=list(ANIMATION_TYPES))
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--size', type=float, default=1.0, help="workload size multiplier")
+    arguments = parser.parse_args(arguments)
+
+    results = benchmarkInterference(arguments.workloads, arguments.drivers, arguments.animations, arguments.repeats, arguments.size)
+    print(formatResults(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+from math import exp
+from time import perf_counter
+
+
+
+class EtaEstimator:
+    """ Estimation of remaining time by progress (from 0 to 1).
+
+        Throughput is exponentially weighted over sliding time window: both progress increments and elapsed time
+        are decayed by exp(-elapsed / window), and throughput is their ratio. So bursts of progress are spread over time
+        between them, and while progress is stalled throughput decreases (remaining time grows).
+        Every update is O(1) - it can be called at any rate.
+    """
+    def __init__(self, window: float = 5.0, stallTimeout: float = None):
+        """INIT."""
+        self.window = window # seconds
+        self.stallTimeout = stallTimeout if stallTimeout is not None else window # seconds without progress - estimation is unknown
+        self.reset()
+
+
+    def reset(self):
+        """Forget history (new task)."""
+        self._progress = None
+        self._time = None
+        self._progressChangeTime = None
+        self._weightedProgress = 0.0
+        self._weightedTime = 0.0
+
+
+    @property
+    def throughput(self):
+        """Progress per second, or None if there is not enough history."""
+        if self._weightedTime < min(1.0, self.window):
+            return None
+        return self._weightedProgress / self._weightedTime
+
+
+    def update(self, progress: float, currentTime: float = None):
+        """Add progress sample."""
+        if currentTime is None:
+            currentTime = perf_counter()
+
+        # first sample or progress restart
+        if self._progress is None or progress < self._progress:
+            self.reset()
+            self._progress = progress
+            self._time = currentTime
+            self._progressChangeTime = currentTime
+            return
+
+        elapsed = currentTime - self._time
+        if elapsed <= 0:
+            return
+        decay = exp(-elapsed / self.window)
+        self._weightedProgress = self._weightedProgress * decay + (progress - self._progress)
+        self._weightedTime = self._weightedTime * decay + elapsed
+
+        if progress != self._progress:
+            self._progressChangeTime = currentTime
+        self._progress = progress
+        self._time = currentTime
+
+
+    def remaining(self, currentTime: float = None):
+        """Remaining time in seconds, or None if it is unknown (not enough history or progress is stalled)."""
+        if self._progress is None:
+            return None
+        if currentTime is None:
+            currentTime = perf_counter()
+        if currentTime - self._progressChangeTime > self.stallTimeout:
+            return None
+
+        throughput = self.throughput
+        if not throughput or throughput <= 0:
+            return None
+        return max(0.0, 1 - self._progress) / throughput
+
+
+
+def formatDuration(seconds: float):
+    """Short text of duration: '12 s', '3 min 5 s', '1 h 2 min'."""
+    seconds = round(seconds)
+    if seconds < 60:
+        return "{} s".format(seconds)
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return "{} min {} s".format(minutes, seconds)
+    hours, minutes = divmod(minutes, 60)
+    return "{} h {} min".format(hours, minutes)
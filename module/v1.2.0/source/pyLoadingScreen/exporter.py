@@ -0,0 +1,347 @@
+import os
+import sys
+import math
+import warnings
+import multiprocessing
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from pyLoadingScreen.pyLoadingScreen import LoadingScreen
+from pyLoadingScreen.animations import POINT_RECORD_SIZE, LINE_RECORD_SIZE
+
+
+FRAMES_PER_SECOND = 30 # LoadingScreen frame rate, see LoadingScreen._iterationDelay
+
+
+def _qApplication():
+    """QApplication instance. If there is no display (headless linux) - it is created at 'offscreen' platform."""
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        if sys.platform.startswith('linux') and not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        app = QtWidgets.QApplication([])
+    return app
+
+
+def _qImageToPil(image: object):
+    """Convert QImage (Format_RGB888) to PIL.Image."""
+    from PIL import Image
+
+    data = image.bits().asstring(image.sizeInBytes())
+    return Image.frombuffer('RGB', (image.width(), image.height()), data, 'raw', 'RGB', image.bytesPerLine(), 1)
+
+
+def _drawPlaceCreate(windowSize: tuple, backgroundRGBColor: tuple, drawPlaceParams: dict):
+    """Draw place of animation for offscreen rendering."""
+    drawPlace = LoadingScreen.MyDrawingPlace(None, **dict({'remoteMode': False}, **drawPlaceParams)) # full quality in any session
+    drawPlace.setStyleSheet("background-color: rgb({}, {}, {});".format(*backgroundRGBColor))
+    drawPlace.resize(*windowSize)
+    drawPlace.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+    drawPlace.show() # polish and resize, but not show on screen
+    return drawPlace
+
+
+def _loopFramesCount(drawPlace: object, stepsPerFrame: int):
+    """ Count of frames in one loop of exported animation - by analytic period of animation (animations.Animation.period)
+        and period of rainbow color (color is switched by every frame). None - animation is not periodic.
+    """
+    layout = drawPlace._layoutGet()
+    period = drawPlace._period
+    if period is None:
+        return None
+    framesCount = period // math.gcd(period, stepsPerFrame)
+
+    # rainbow color is used only by records with default color (-1)
+    frame = drawPlace._animation.frame(0, layout)
+    if drawPlace.colorRainbow and (any(r < 0 for r in frame.points[2::POINT_RECORD_SIZE])
+            or any(r < 0 for r in frame.lines[4::LINE_RECORD_SIZE])):
+        colorsCount = sum(1 for _ in drawPlace._colorRainbowGenerator(oneRound=True))
+        framesCount = framesCount * colorsCount // math.gcd(framesCount, colorsCount)
+    return framesCount
+
+
+def _renderFrames(drawPlace: object, stepsPerFrame: int, framesCount: int, convert: object):
+    """Render framesCount frames of animation one by one - yields convert(QImage), frame is not kept."""
+    image = QtGui.QImage(drawPlace.width(), drawPlace.height(), QtGui.QImage.Format_RGB888)
+    for _ in range(framesCount):
+        for _ in range(stepsPerFrame):
+            next(drawPlace.worker)
+        drawPlace.render(image)
+        yield convert(image)
+
+
+def _savedFramesCount(fileName: str, frameDuration: int):
+    """Count of frames in saved animated image - by total duration, equal consecutive frames are merged by encoder."""
+    from PIL import Image
+
+    duration = 0
+    with Image.open(fileName) as image:
+        for idx in range(getattr(image, 'n_frames', 1)):
+            image.seek(idx)
+            duration += image.info.get('duration', frameDuration)
+    return round(duration / frameDuration)
+
+
+def exportAnimation(fileName: str,
+        windowSize = (350, 350),
+        framesPerSecond = 30,
+        backgroundRGBColor = (0, 0, 0),
+        maxFramesCount = 1500,
+
+        animationType = "RoundRobin",
+        animationDetailСoefficient = 20,
+        animationRGBColor = (255, 0, 0),
+        animationColorRainbow = True,
+        animationColorRainbowStep = 2,
+        animationColorRainbowMinValues = (0, 0, 0),
+        animationColorRainbowMaxValues = (255, 255, 255),
+        animationLineWidth = 3,
+        animationScale = 0.95,
+        animationCountStepsPerRound = 1440,
+        animationRenderQuality = "High",
+        ):
+    """ Render one cycle of built-in animation offscreen and save it as animated image.
+
+        Format is selected by file extension: '.gif', '.png' / '.apng' (APNG) or '.webp'.
+        Requires Pillow: 'pip install py-loading-screen[export]'. Works on headless linux ('offscreen' Qt platform).
+
+        Animation params are the same, as LoadingScreen params.
+        framesPerSecond - frame rate of exported image. Animation speed is kept: if framesPerSecond is less than 30,
+            then some animation steps are skipped.
+        maxFramesCount - limit of frames in loop. Loop length is computed from period of animation and period of rainbow
+            color. If loop is longer (for example, default "RoundRobin" with rainbow color - 171360 frames) or animation
+            is not periodic, then RuntimeWarning is issued and first maxFramesCount frames are exported - image does not
+            loop seamlessly (set animationColorRainbow=False for seamless loop).
+
+        Frames are rendered and passed to encoder one by one (raw frames are not kept), except APNG - Pillow reads its
+        frames twice, so they are kept in memory. Equal consecutive frames are merged by encoder (GIF, APNG), other frames
+        are stored as difference with previous frame. Count of frames in saved image is checked (RuntimeError if differs).
+
+        Returns count of rendered frames.
+    """
+    from PIL import PngImagePlugin
+
+    extension = os.path.splitext(fileName)[1].lower()
+    if extension not in ('.gif', '.png', '.apng', '.webp'):
+        raise ValueError("Unsupported animated image format: '{}'".format(extension))
+
+    app = _qApplication() # keep reference while rendering
+
+    drawPlace = _drawPlaceCreate(windowSize, backgroundRGBColor, {
+        'animationType': animationType,
+        'detailСoefficient': animationDetailСoefficient,
+        'color': animationRGBColor,
+        'colorRainbow': animationColorRainbow,
+        'colorRainbowStep': animationColorRainbowStep,
+        'colorRainbowMinValues': animationColorRainbowMinValues,
+        'colorRainbowMaxValues': animationColorRainbowMaxValues,
+        'lineWidth': animationLineWidth,
+        'scale': animationScale,
+        'countStepsPerRound': animationCountStepsPerRound,
+        'renderQuality': animationRenderQuality
+        })
+
+    stepsPerFrame = max(1, round(FRAMES_PER_SECOND / framesPerSecond))
+    frameDuration = round(1000 * stepsPerFrame / FRAMES_PER_SECOND)
+    try:
+        framesCount = _loopFramesCount(drawPlace, stepsPerFrame)
+        if framesCount is None or framesCount > maxFramesCount:
+            warnings.warn("Animation loop is {} frames, first {} frames are exported - image does not loop seamlessly".format(
+                framesCount if framesCount is not None else "not periodic", maxFramesCount), RuntimeWarning, stacklevel=2)
+            framesCount = maxFramesCount
+
+        if extension == '.gif':
+            convert = lambda image: _qImageToPil(image).quantize()
+        else:
+            convert = _qImageToPil
+        images = _renderFrames(drawPlace, stepsPerFrame, framesCount, convert)
+        firstImage = next(images)
+
+        if extension == '.gif':
+            firstImage.save(fileName, save_all=True, append_images=images, duration=frameDuration, loop=0,
+                optimize=True, disposal=1)
+        elif extension == '.webp':
+            firstImage.save(fileName, save_all=True, append_images=images, duration=frameDuration, loop=0,
+                lossless=True, minimize_size=True)
+        else:
+            # APNG encoder iterates append_images twice (modes and sizes, then frames) - generator is not enough
+            firstImage.save(fileName, format='PNG', save_all=True, append_images=list(images), duration=frameDuration, loop=0,
+                optimize=True, disposal=PngImagePlugin.Disposal.OP_NONE, blend=PngImagePlugin.Blend.OP_SOURCE)
+    finally:
+        drawPlace.worker.close()
+        drawPlace.deleteLater()
+
+    savedFramesCount = _savedFramesCount(fileName, frameDuration)
+    if savedFramesCount != framesCount:
+        raise RuntimeError("Saved image '{}' has {} frames instead of {}".format(fileName, savedFramesCount, framesCount))
+    return framesCount
+
+
+def _renderSpriteSheetCells(sharedMemoryName: str, sheetWidth: int, windowSize: tuple, columnsCount: int, pageFirstFrameIdx: int,
+        firstFrameIdx: int, lastFrameIdx: int, stepsPerFrame: int, backgroundRGBColor: tuple, drawPlaceParams: dict):
+    """ Render frames [firstFrameIdx, lastFrameIdx) of sprite sheet page straight into its cells (worker process).
+
+        Page of sprite sheet (from frame pageFirstFrameIdx) is Format_RGB32 image in shared memory, so frames are not sent
+        back through pipe.
+    """
+    app = _qApplication() # keep reference while rendering
+
+    sharedMemory = shared_memory.SharedMemory(name=sharedMemoryName)
+    drawPlace = _drawPlaceCreate(windowSize, backgroundRGBColor, drawPlaceParams)
+    try:
+        width, height = windowSize
+        frameBytesPerLine = width * 4
+        sheetBytesPerLine = sheetWidth * 4
+        sheet = sharedMemory.buf
+        image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB32)
+
+        # rainbow color is switched by every paint - skip colors of previous frames
+        for _ in range(firstFrameIdx):
+            next(drawPlace._colorRainbowGeneratorInstance)
+
+        for frameIdx in range(firstFrameIdx, lastFrameIdx):
+            drawPlace._frame = drawPlace._frameGet(frameIdx * stepsPerFrame)
+            drawPlace.render(image)
+
+            data = image.bits().asstring(image.sizeInBytes())
+            row, column = divmod(frameIdx - pageFirstFrameIdx, columnsCount)
+            offset = row * height * sheetBytesPerLine + column * frameBytesPerLine
+            for lineOffset in range(0, height * frameBytesPerLine, frameBytesPerLine):
+                sheet[offset:offset + frameBytesPerLine] = data[lineOffset:lineOffset + frameBytesPerLine]
+                offset += sheetBytesPerLine
+    finally:
+        sharedMemory.close()
+        drawPlace.deleteLater()
+
+    return lastFrameIdx - firstFrameIdx
+
+
+def exportSpriteSheet(fileName: str,
+        windowSize = (350, 350),
+        framesPerSecond = 30,
+        framesCount = None,
+        columnsCount = None,
+        processesCount = None,
+        backgroundRGBColor = (0, 0, 0),
+        pageSize = (16384, 16384),
+
+        animationType = "RoundRobin",
+        animationDetailСoefficient = 20,
+        animationRGBColor = (255, 0, 0),
+        animationColorRainbow = True,
+        animationColorRainbowStep = 2,
+        animationColorRainbowMinValues = (0, 0, 0),
+        animationColorRainbowMaxValues = (255, 255, 255),
+        animationLineWidth = 3,
+        animationScale = 0.95,
+        animationCountStepsPerRound = 1440,
+        animationRenderQuality = "High",
+        ):
+    """ Pre-render frames of built-in animation in parallel processes and save them as sprite sheet image (or pages of it).
+
+        Frames are placed in grid of columnsCount columns (default - square grid), row by row.
+        Format is selected by file extension (any format, that is supported by QImage: '.png', '.bmp', '.jpg' and etc.).
+        pageSize - max size of image (pixels, default - common max texture size). If frames do not fit in one image, columns
+            are limited by page width and frames are split into pages: 'name_0.png', 'name_1.png' and etc.
+
+        Animation params are the same, as LoadingScreen params.
+        framesPerSecond - frame rate of sprite sheet, as in exportAnimation.
+        framesCount - count of frames, default - one round of animation (animationCountStepsPerRound steps).
+        processesCount - count of worker processes, default - count of CPUs. Steps range is split between processes,
+            every process renders its frames offscreen straight into shared memory of sprite sheet.
+
+        Processes are started by 'spawn' method, so call it under "if __name__ == '__main__':" in scripts.
+        Returns dict: 'pages' - file names of pages, 'columnsCount', 'frames' - (page index, x, y, width, height) of every frame.
+    """
+    stepsPerFrame = max(1, round(FRAMES_PER_SECOND / framesPerSecond))
+    if framesCount is None:
+        framesCount = math.ceil(animationCountStepsPerRound / stepsPerFrame)
+    if columnsCount is None:
+        columnsCount = math.ceil(math.sqrt(framesCount))
+    if processesCount is None:
+        processesCount = os.cpu_count() or 1
+
+    width, height = windowSize
+    if width > pageSize[0] or height > pageSize[1]:
+        raise ValueError("Frame {}x{} is larger than pageSize".format(width, height))
+    columnsCount = min(columnsCount, pageSize[0] // width)
+    rowsPerPage = min(math.ceil(framesCount / columnsCount), pageSize[1] // height,
+        (2 ** 31 - 1) // (columnsCount * width * 4 * height)) # QImage limit
+    framesPerPage = columnsCount * rowsPerPage
+    pagesCount = math.ceil(framesCount / framesPerPage)
+    if pagesCount == 1:
+        pageFileNames = [fileName]
+    else:
+        name, extension = os.path.splitext(fileName)
+        pageFileNames = ['{}_{}{}'.format(name, pageIdx, extension) for pageIdx in range(pagesCount)]
+
+    drawPlaceParams = {
+        'animationType': animationType,
+        'detailСoefficient': animationDetailСoefficient,
+        'color': animationRGBColor,
+        'colorRainbow': animationColorRainbow,
+        'colorRainbowStep': animationColorRainbowStep,
+        'colorRainbowMinValues': animationColorRainbowMinValues,
+        'colorRainbowMaxValues': animationColorRainbowMaxValues,
+        'lineWidth': animationLineWidth,
+        'scale': animationScale,
+        'countStepsPerRound': animationCountStepsPerRound,
+        'renderQuality': animationRenderQuality
+    }
+
+    with ProcessPoolExecutor(processesCount, mp_context=multiprocessing.get_context('spawn')) as executor:
+        for pageIdx, pageFileName in enumerate(pageFileNames):
+            pageFirstFrameIdx = pageIdx * framesPerPage
+            pageFramesCount = min(framesPerPage, framesCount - pageFirstFrameIdx)
+            _renderSpriteSheetPage(executor, processesCount, pageFileName, pageFirstFrameIdx, pageFramesCount, columnsCount,
+                windowSize, stepsPerFrame, backgroundRGBColor, drawPlaceParams)
+
+    frames = []
+    for frameIdx in range(framesCount):
+        pageIdx, cellIdx = divmod(frameIdx, framesPerPage)
+        row, column = divmod(cellIdx, columnsCount)
+        frames.append((pageIdx, column * width, row * height, width, height))
+    return {'pages': pageFileNames, 'columnsCount': columnsCount, 'frames': frames}
+
+
+def _renderSpriteSheetPage(executor: object, processesCount: int, fileName: str, pageFirstFrameIdx: int, pageFramesCount: int,
+        columnsCount: int, windowSize: tuple, stepsPerFrame: int, backgroundRGBColor: tuple, drawPlaceParams: dict):
+    """Render frames of sprite sheet page by process pool into shared memory and save page."""
+    rowsCount = math.ceil(pageFramesCount / columnsCount)
+    sheetWidth = columnsCount * windowSize[0]
+    sheetHeight = rowsCount * windowSize[1]
+    sheetSizeInBytes = sheetWidth * sheetHeight * 4
+
+    # contiguous ranges of frames, few per process - for load balancing
+    rangesCount = min(pageFramesCount, processesCount * 4)
+    bounds = [pageFirstFrameIdx + pageFramesCount * idx // rangesCount for idx in range(rangesCount + 1)]
+
+    sharedMemory = shared_memory.SharedMemory(create=True, size=sheetSizeInBytes)
+    try:
+        tasks = [
+            executor.submit(_renderSpriteSheetCells, sharedMemory.name, sheetWidth, windowSize, columnsCount, pageFirstFrameIdx,
+                firstFrameIdx, lastFrameIdx, stepsPerFrame, backgroundRGBColor, drawPlaceParams)
+            for firstFrameIdx, lastFrameIdx in zip(bounds, bounds[1:])
+            ]
+        for task in tasks:
+            task.result()
+
+        data = bytes(sharedMemory.buf[:sheetSizeInBytes])
+    finally:
+        sharedMemory.close()
+        sharedMemory.unlink()
+
+    # fill empty cells of last row by background
+    sheet = QtGui.QImage(data, sheetWidth, sheetHeight, sheetWidth * 4, QtGui.QImage.Format_RGB32)
+    emptyCellsCount = rowsCount * columnsCount - pageFramesCount
+    if emptyCellsCount:
+        sheet = sheet.copy()
+        painter = QtGui.QPainter(sheet)
+        painter.fillRect(sheetWidth - emptyCellsCount * windowSize[0], sheetHeight - windowSize[1],
+            emptyCellsCount * windowSize[0], windowSize[1], QtGui.QColor(*backgroundRGBColor))
+        painter.end()
+
+    if not sheet.save(fileName):
+        raise OSError("Can't save sprite sheet: '{}'".format(fileName))
+
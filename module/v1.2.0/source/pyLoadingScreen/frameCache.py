@@ -0,0 +1,193 @@
+import os
+import sys
+import mmap
+import struct
+import hashlib
+from array import array
+from threading import Thread
+
+from pyLoadingScreen.animations import FrameBuffer, POINT_RECORD_SIZE, LINE_RECORD_SIZE
+
+
+FORMAT_MAGIC = b'PLSFRAME'
+FORMAT_VERSION = 2
+FILE_EXTENSION = '.plsframes'
+
+# file: header, frames index, frames data (float32 point and line records of animations.FrameBuffer)
+_header = struct.Struct('<8sII')       # magic, format version, frames count
+_frameIndex = struct.Struct('<IIQ')   # points count, lines count, offset of frame data (in records items)
+
+
+def cacheKey(params: tuple):
+    """Cache key - hash of all animation params and widget size."""
+    return hashlib.sha1(repr((FORMAT_VERSION, sys.byteorder, params)).encode('utf-8')).hexdigest()
+
+
+def cachePath(cacheDir: str, params: tuple):
+    """Path of cache file for animation params."""
+    return os.path.join(cacheDir, cacheKey(params) + FILE_EXTENSION)
+
+
+def encodeFrame(frame: FrameBuffer):
+    """Encode frame to (points count, lines count, float32 records bytes)."""
+    return (frame.pointsCount, frame.linesCount, array('f', frame.points).tobytes() + array('f', frame.lines).tobytes())
+
+
+def saveFrameCache(cacheDir: str, params: tuple, frames: list, maxSize: int = None):
+    """ Save encoded frames (cycle of animation) to cache file. File is replaced atomically.
+
+        maxSize - limit of total size of cache files in cacheDir (bytes): least recently used files are removed
+        (see evictFrameCaches), cache larger than maxSize is not saved (returns None). None - without limit.
+    """
+    size = _header.size + len(frames) * _frameIndex.size + sum(len(data) for _, _, data in frames)
+    if maxSize is not None and size > maxSize:
+        return None
+    os.makedirs(cacheDir, exist_ok=True)
+    path = cachePath(cacheDir, params)
+    temporaryPath = '{}.{}.tmp'.format(path, os.getpid())
+
+    with open(temporaryPath, 'wb') as file:
+        file.write(_header.pack(FORMAT_MAGIC, FORMAT_VERSION, len(frames)))
+        offset = 0
+        for pointsCount, linesCount, data in frames:
+            file.write(_frameIndex.pack(pointsCount, linesCount, offset))
+            offset += len(data) // 4
+        for _, _, data in frames:
+            file.write(data)
+
+    os.replace(temporaryPath, path)
+    if maxSize is not None:
+        evictFrameCaches(cacheDir, maxSize, path)
+    return path
+
+
+def evictFrameCaches(cacheDir: str, maxSize: int, keepPath: str = None):
+    """ Remove least recently used cache files (by modification time - it is updated on open of cache), while total size
+        of cache files in cacheDir is over maxSize (bytes). keepPath is not removed, files in use (Windows) are skipped.
+    """
+    files = []
+    with os.scandir(cacheDir) as entries:
+        for entry in entries:
+            if entry.name.endswith(FILE_EXTENSION) and entry.path != keepPath:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+    totalSize = sum(size for _, size, _ in files)
+    if keepPath is not None:
+        totalSize += os.path.getsize(keepPath)
+    for _, size, path in sorted(files): # oldest first
+        if totalSize <= maxSize:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        totalSize -= size
+
+
+
+class FrameCacheBuilder(Thread):
+    """ Background thread - computes frames of animation cycle by pure frame function and saves them to cache file.
+
+        Cache is ready after first layout build, without recording of played frames, so short repeated startups use it.
+        Thread does not touch widget - frame function and layout are passed. 'path' is set when cache file is saved.
+        maxSize - limit of total size of cache directory (see saveFrameCache).
+    """
+    def __init__(self, cacheDir: str, params: tuple, frame: object, layout: dict, framesCount: int, maxSize: int = None):
+        """INIT."""
+        Thread.__init__(self, name="pyLoadingScreenFrameCache", daemon=True)
+        self.cacheDir = cacheDir
+        self.params = params
+        self.frame = frame
+        self.layout = layout
+        self.framesCount = framesCount
+        self.maxSize = maxSize
+        self.isCancelled = False
+        self.path = None
+
+
+    def cancel(self):
+        """Stop computation (layout is changed), cache is not saved."""
+        self.isCancelled = True
+
+
+    def run(self):
+        frames = []
+        for phase in range(self.framesCount):
+            if self.isCancelled:
+                return
+            frames.append(encodeFrame(self.frame(phase, self.layout)))
+        try:
+            self.path = saveFrameCache(self.cacheDir, self.params, frames, self.maxSize)
+        except OSError:
+            pass
+
+
+
+class FrameCache:
+    """ Cached cycle of animation frames (or first frames of long cycle), read from memory-mapped file.
+
+        Frames are not copied - FrameBuffer records are views of memory-mapped file,
+        so resident memory is only pages of currently played frames.
+    """
+    def __init__(self, path: str):
+        """INIT."""
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, framesCount = _header.unpack_from(self._mmap, 0)
+            if magic != FORMAT_MAGIC or version != FORMAT_VERSION:
+                raise ValueError("Unsupported frame cache format: '{}'".format(path))
+
+            self._index = [
+                _frameIndex.unpack_from(self._mmap, _header.size + idx * _frameIndex.size)
+                for idx in range(framesCount)
+                ]
+            dataOffset = _header.size + framesCount * _frameIndex.size
+            self._data = memoryview(self._mmap)[dataOffset:].cast('f')
+        except (ValueError, struct.error):
+            self._mmap.close()
+            raise
+
+
+    @classmethod
+    def open(cls, cacheDir: str, params: tuple):
+        """Open cache for animation params. Returns None if there is no valid cache. Cache file is marked as recently used."""
+        path = cachePath(cacheDir, params)
+        try:
+            cache = cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        try:
+            os.utime(path) # least recently used files are evicted first
+        except OSError:
+            pass
+        return cache
+
+
+    def __len__(self):
+        return len(self._index)
+
+
+    def frame(self, frameIdx: int):
+        """Frame (FrameBuffer)."""
+        pointsCount, linesCount, offset = self._index[frameIdx]
+        linesOffset = offset + pointsCount * POINT_RECORD_SIZE
+        return FrameBuffer(
+            self._data[offset:linesOffset],
+            self._data[linesOffset:linesOffset + linesCount * LINE_RECORD_SIZE]
+            )
+
+
+    def close(self):
+        """Close memory-mapped file. If frames of cache are still in use - file is closed, when they are released."""
+        self._data.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
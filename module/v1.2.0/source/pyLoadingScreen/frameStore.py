@@ -0,0 +1,84 @@
+from threading import Condition
+from collections import deque
+
+from pyLoadingScreen.animations import FrameBuffer
+
+
+
+class FrameQueue:
+    """ Bounded lookahead queue of frames between producer thread and consumer (worker at GUI thread).
+
+        Items are (phase, tag, frame, frameRect, source); tag - version of layout, that frame is computed with,
+        source - (animation, layout), that frame is computed with (consumer does not read layout, that is rebuilt by producer).
+        Producer is throttled (blocked in 'put') while queue is full.
+        Consumer takes frame of requested phase by 'pop' - frames of older phases (consumer is behind)
+        and frames of other layout versions are dropped as stale.
+
+        Metrics: 'depth' - current count of frames in queue, 'depthAverage' - average depth at 'pop',
+        'droppedCount' - count of stale frames, 'underrunCount' - count of 'pop' without frame.
+    """
+    def __init__(self, maxSize: int = 8):
+        """INIT."""
+        self.maxSize = max(1, maxSize)
+        self._items = deque()
+        self._condition = Condition()
+        self.isClosed = False
+
+        self.consumerPhase = 0
+        self._poppedPhase = None
+        self.depthAverage = 0.0
+        self.droppedCount = 0
+        self.underrunCount = 0
+
+
+    @property
+    def depth(self):
+        return len(self._items)
+
+
+    def put(self, phase: int, tag: object, frame: FrameBuffer, frameRect: object = None, source: tuple = None):
+        """Add frame, wait while queue is full. Returns False, if queue is closed."""
+        with self._condition:
+            while len(self._items) >= self.maxSize and not self.isClosed:
+                self._condition.wait()
+            if self.isClosed:
+                return False
+            self._items.append((phase, tag, frame, frameRect, source))
+            return True
+
+
+    def pop(self, phase: int, tag: object):
+        """ Newest frame with phase not greater than 'phase' and with 'tag' - (frame, frameRect, source),
+            or None if there is no such frame yet.
+        """
+        with self._condition:
+            self.consumerPhase = phase
+            items = self._items
+            self.depthAverage += (len(items) - self.depthAverage) * 0.1
+
+            item = None
+            while items and (items[0][0] <= phase or items[0][1] != tag):
+                staleItem = items.popleft()
+                if staleItem[1] != tag:
+                    self.droppedCount += 1
+                    continue
+                if item is not None:
+                    self.droppedCount += 1
+                item = staleItem
+            self._condition.notify_all()
+
+            if item is None:
+                # frame of this phase is already taken - not underrun (same phase can be requested by time-based playback)
+                if phase != self._poppedPhase:
+                    self.underrunCount += 1
+                return None
+            self._poppedPhase = phase
+            return item[2:]
+
+
+    def close(self):
+        """Close queue and release waiting producer."""
+        with self._condition:
+            self.isClosed = True
+            self._items.clear()
+            self._condition.notify_all()
@@ -0,0 +1,184 @@
+import os
+import sys
+import json
+import zlib
+import tempfile
+import threading
+import importlib.abc
+from time import perf_counter_ns
+
+
+
+def _countFileDefault():
+    """File of imports count of main script (in temp directory)."""
+    mainFile = os.path.abspath(sys.argv[0]) if sys.argv and sys.argv[0] else "interactive"
+    return os.path.join(tempfile.gettempdir(), "pyLoadingScreen", "imports_{:08x}.json".format(zlib.crc32(mainFile.encode('utf-8'))))
+
+
+
+class ImportProgressHook(importlib.abc.MetaPathFinder):
+    """ sys.meta_path hook - counts and times imports of modules (see LoadingScreen param importProgress).
+
+        Spec is found by next finders of sys.meta_path, its loader is wrapped to time module creation and execution
+        (original loader is restored to module after execution). Time of module is cumulative (with nested imports)
+        and self (without them). Count of imports is saved to countFile at 'save', and on next run progress is
+        estimated as count of imports / saved count.
+    """
+    def __init__(self, countFile: str = None, labelDelay: float = 0.1):
+        """INIT."""
+        self.countFile = countFile if countFile is not None else _countFileDefault()
+        self.labelDelay = labelDelay # seconds - min delay between label updates by name of imported module
+        self.importsCount = 0
+        self.expectedCount = self._countLoad()
+        self.times = {} # module name -> (cumulative time, self time) in ns
+        self.current = None # name of module, that is being imported now
+        self.isInstalled = False
+        self._local = threading.local()
+
+
+    def _countLoad(self):
+        """Count of imports, saved on previous run (None - unknown)."""
+        try:
+            with open(self.countFile, encoding='utf-8') as file:
+                return int(json.load(file)['importsCount']) or None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+    def save(self):
+        """Save count of imports for progress estimation on next run."""
+        try:
+            os.makedirs(os.path.dirname(self.countFile), exist_ok=True)
+            with open(self.countFile, 'w', encoding='utf-8') as file:
+                json.dump({'importsCount': self.importsCount}, file)
+        except OSError:
+            pass # estimation is optional
+
+
+    @property
+    def progress(self):
+        """Estimated progress of imports (from 0 to 1), None - there is no count of previous run."""
+        if self.expectedCount is None:
+            return None
+        return min(1.0, self.importsCount / self.expectedCount)
+
+
+    def install(self):
+        """Insert hook to start of sys.meta_path."""
+        if not self.isInstalled:
+            sys.meta_path.insert(0, self)
+            self.isInstalled = True
+
+
+    def uninstall(self):
+        """Remove hook from sys.meta_path."""
+        if self.isInstalled:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self.isInstalled = False
+
+
+    def find_spec(self, fullname: str, path: object = None, target: object = None):
+        """importlib.abc.MetaPathFinder.find_spec"""
+        # imports of other finders while finding are not timed
+        if getattr(self._local, 'isFinding', False):
+            return None
+        self._local.isFinding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.isFinding = False
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module') and not isinstance(spec.loader, _TimedLoader):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+
+    def _stack(self):
+        """Modules of current thread, that are being imported: [name, start time, time of nested imports]."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+    def _begin(self, name: str):
+        self.importsCount += 1
+        self.current = name
+        self._stack().append([name, perf_counter_ns(), 0])
+
+
+    def _end(self, name: str):
+        stack = self._stack()
+        if not stack or stack[-1][0] != name:
+            return
+        name, startTime, nestedTime = stack.pop()
+        elapsed = perf_counter_ns() - startTime
+        self.times[name] = (elapsed, max(0, elapsed - nestedTime))
+        if stack:
+            stack[-1][2] += elapsed
+            self.current = stack[-1][0]
+        else:
+            self.current = None
+
+
+    def slowest(self, count: int = 10, bySelfTime: bool = False):
+        """Slowest imports - list of (module name, cumulative time, self time) in seconds."""
+        key = 1 if bySelfTime else 0
+        names = sorted(self.times, key=lambda name: self.times[name][key], reverse=True)[:count]
+        return [(name, self.times[name][0] / 1e9, self.times[name][1] / 1e9) for name in names]
+
+
+    def report(self, count: int = 10):
+        """Text table of slowest imports (by cumulative time) - candidates to lazy import."""
+        lines = ["{} imports, slowest:".format(self.importsCount),
+            "{:<50} {:>14} {:>10}".format("module", "cumulative, ms", "self, ms")]
+        for name, cumulativeTime, selfTime in self.slowest(count):
+            lines.append("{:<50} {:>14.1f} {:>10.1f}".format(name, cumulativeTime * 1e3, selfTime * 1e3))
+        return "\n".join(lines)
+
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wrapper of loader - times creation and execution of module by ImportProgressHook, other attributes are of original loader."""
+    def __init__(self, loader: object, hook: ImportProgressHook):
+        """INIT."""
+        self._loader = loader
+        self._hook = hook
+
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+
+    def create_module(self, spec: object):
+        """importlib.abc.Loader.create_module"""
+        self._hook._begin(spec.name)
+        try:
+            return self._loader.create_module(spec)
+        except BaseException:
+            self._hook._end(spec.name)
+            raise
+
+
+    def exec_module(self, module: object):
+        """importlib.abc.Loader.exec_module"""
+        spec = module.__spec__
+        # original loader - module does not depend on hook after import
+        if spec is not None and spec.loader is self:
+            spec.loader = self._loader
+        if getattr(module, '__loader__', None) is self:
+            module.__loader__ = self._loader
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._hook._end(module.__name__ if spec is None else spec.name)
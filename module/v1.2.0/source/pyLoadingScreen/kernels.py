@@ -0,0 +1,180 @@
+from math import sin, cos, radians
+from threading import Thread, Lock
+from importlib.util import find_spec
+
+numpy = None # imported by warm up thread
+
+
+# compiled kernels are installed by 'pip install py-loading-screen[fast]', numba is not imported with package
+available = find_spec('numba') is not None and find_spec('numpy') is not None
+# set to False to use pure python reference implementation of animations (before layout is built)
+enabled = available
+# layouts with lower detail coefficient are computed in pure python - numba import and compilation cost more
+detailThreshold = 100
+# kernels are imported and compiled - until then frames are computed in pure python
+ready = False
+
+_warmUpLock = Lock()
+_warmUpThread = None
+_roundRobinLinesCompiled = None
+_ribbonDanceFrameCompiled = None
+
+
+
+def warmUp():
+    """Import numba and compile kernels in background thread (once) - GUI thread is not blocked by them."""
+    global _warmUpThread
+    with _warmUpLock:
+        if _warmUpThread is None and enabled:
+            _warmUpThread = Thread(target=_warmUp, name="pyLoadingScreenKernels", daemon=True)
+            _warmUpThread.start()
+
+
+def _warmUp():
+    """Warm up thread - compile kernels by call with small data."""
+    global numpy, ready, _roundRobinLinesCompiled, _ribbonDanceFrameCompiled
+    try:
+        import numpy
+        import numba
+    except ImportError:
+        return
+
+    roundRobinLines = numba.njit(cache=True, nogil=True)(_roundRobinLines)
+    roundRobinLines(numpy.zeros(30), numpy.zeros(1), numpy.zeros((1, 3), dtype=numpy.int64), 0.0, 0.0, 1.0, 0.5, 0.0)
+    ribbonDanceFrame = numba.njit(cache=True, nogil=True)(_ribbonDanceFrame)
+    ribbonDanceFrame(numpy.zeros(12), numpy.zeros(20), numpy.zeros(1), numpy.zeros(1), numpy.zeros((1, 6)),
+        0, 0.0, 0.0, 1.0, 0.5)
+
+    _roundRobinLinesCompiled = roundRobinLines
+    _ribbonDanceFrameCompiled = ribbonDanceFrame
+    ready = True
+
+
+def useKernels(detailСoefficient: int):
+    """True if layout with this detail coefficient uses kernels (when they are ready). Starts warm up of kernels."""
+    if not enabled or detailСoefficient < detailThreshold:
+        return False
+    warmUp()
+    return True
+
+
+
+def _roundRobinLines(lines, dotAngles, linesDots, centerX, centerY, radiusOuter, radiusInner, currentAngleRadians):
+    """Round Robin type animation lines coordinates (colors and widths are in lines template)."""
+    dotsCount = dotAngles.shape[0]
+    outerX = numpy.empty(dotsCount)
+    outerY = numpy.empty(dotsCount)
+    innerX = numpy.empty(dotsCount)
+    innerY = numpy.empty(dotsCount)
+    for idx in range(dotsCount):
+        cosDot = cos(currentAngleRadians + dotAngles[idx])
+        sinDot = sin(currentAngleRadians + dotAngles[idx])
+        outerX[idx] = centerX + cosDot * radiusOuter
+        outerY[idx] = centerY + sinDot * radiusOuter
+        innerX[idx] = centerX + cosDot * radiusInner
+        innerY[idx] = centerY - sinDot * radiusInner
+
+    for idx in range(dotsCount):
+        nextIdx = linesDots[idx, 1]
+        connectingIdx = linesDots[idx, 2]
+        offset = idx * 30
+        # outer line
+        lines[offset] = outerX[idx]
+        lines[offset + 1] = outerY[idx]
+        lines[offset + 2] = outerX[nextIdx]
+        lines[offset + 3] = outerY[nextIdx]
+        # inner line
+        lines[offset + 10] = innerX[idx]
+        lines[offset + 11] = innerY[idx]
+        lines[offset + 12] = innerX[nextIdx]
+        lines[offset + 13] = innerY[nextIdx]
+        # connecting line
+        lines[offset + 20] = outerX[idx]
+        lines[offset + 21] = outerY[idx]
+        lines[offset + 22] = innerX[connectingIdx]
+        lines[offset + 23] = innerY[connectingIdx]
+
+
+def _ribbonDanceFrame(points, lines, sectionsX, angleOffsets, colors, colorShift, currentAngle, centerY, halfHight, quarterHight):
+    """RibbonDance type animation points and lines."""
+    colorsCount = colors.shape[0]
+    for sectionId in range(sectionsX.shape[0]):
+        x = sectionsX[sectionId]
+        angleY = angleOffsets[sectionId] + currentAngle
+        trigonometryCoef = sin(radians(angleY))
+        indentY = trigonometryCoef * halfHight
+
+        if (angleY % 360) / 180 > 1:
+            y11 = centerY + indentY + 7
+            y21 = centerY - indentY - 7
+            pointY1 = y11 - 5
+            pointY2 = y21 + 5
+        else:
+            y11 = centerY + indentY - 7
+            y21 = centerY - indentY + 7
+            pointY1 = y11 + 5
+            pointY2 = y21 - 5
+
+        y12 = y11 - trigonometryCoef * quarterHight
+        y22 = y21 + trigonometryCoef * quarterHight
+
+        colorIdx = (sectionId + colorShift) % colorsCount
+
+        offset = sectionId * 12
+        points[offset] = x
+        points[offset + 1] = pointY1
+        points[offset + 6] = x
+        points[offset + 7] = pointY2
+        for idx in range(3):
+            points[offset + 2 + idx] = colors[colorIdx, 3 + idx]
+            points[offset + 8 + idx] = colors[colorIdx, idx]
+        points[offset + 5] = 4
+        points[offset + 11] = 4
+
+        offset = sectionId * 20
+        lines[offset] = x
+        lines[offset + 1] = y11
+        lines[offset + 2] = x
+        lines[offset + 3] = y12
+        lines[offset + 10] = x
+        lines[offset + 11] = y21
+        lines[offset + 12] = x
+        lines[offset + 13] = y22
+        for idx in range(3):
+            lines[offset + 4 + idx] = colors[colorIdx, idx]
+            lines[offset + 14 + idx] = colors[colorIdx, 3 + idx]
+        for lineOffset in (offset, offset + 10):
+            lines[lineOffset + 7] = -1 # width
+            lines[lineOffset + 8] = 1 # GRADIENT_LINEAR
+            lines[lineOffset + 9] = 1 # gradientReverse
+
+
+
+def prepareRoundRobin(layout: dict):
+    """Add kernel data to Round Robin type animation layout."""
+    layout['kernelDotAngles'] = numpy.array(layout['dotAngles'], dtype=numpy.float64)
+    layout['kernelLinesDots'] = numpy.array(layout['linesDots'], dtype=numpy.int64).reshape(-1, 3)
+
+
+def roundRobinLines(lines: object, layout: dict, centerX: float, centerY: float, radiusOuter: float, radiusInner: float, currentAngleRadians: float):
+    """Write Round Robin type animation lines coordinates straight into lines buffer (array of lines template)."""
+    if 'kernelDotAngles' not in layout:
+        prepareRoundRobin(layout)
+    _roundRobinLinesCompiled(numpy.frombuffer(lines, dtype=numpy.float64), layout['kernelDotAngles'], layout['kernelLinesDots'],
+        centerX, centerY, radiusOuter, radiusInner, currentAngleRadians)
+
+
+def prepareRibbonDance(layout: dict):
+    """Add kernel data to RibbonDance type animation layout."""
+    layout['kernelSectionsX'] = numpy.array([x for x, _ in layout['sections']], dtype=numpy.float64)
+    layout['kernelAngleOffsets'] = numpy.array([angleOffset for _, angleOffset in layout['sections']], dtype=numpy.float64)
+    layout['kernelColors'] = numpy.array([color1 + color2 for color1, color2 in layout['colorVector']], dtype=numpy.float64)
+
+
+def ribbonDanceFrame(points: object, lines: object, layout: dict, colorShift: int, currentAngle: float, centerY: float, halfHight: float, quarterHight: float):
+    """Write RibbonDance type animation points and lines straight into buffers."""
+    if 'kernelSectionsX' not in layout:
+        prepareRibbonDance(layout)
+    _ribbonDanceFrameCompiled(numpy.frombuffer(points, dtype=numpy.float64), numpy.frombuffer(lines, dtype=numpy.float64),
+        layout['kernelSectionsX'], layout['kernelAngleOffsets'], layout['kernelColors'],
+        colorShift, currentAngle, centerY, halfHight, quarterHight)
@@ -0,0 +1,182 @@
+import gc
+import os
+import sys
+import weakref
+import argparse
+import statistics
+import tracemalloc
+from PyQt5 import QtCore, QtGui, sip
+
+from pyLoadingScreen.pyLoadingScreen import LoadingScreen
+from pyLoadingScreen.exporter import _qApplication, _drawPlaceCreate
+
+
+ANIMATION_TYPES = ("RoundRobin", "RibbonDance")
+
+# tracked budgets (by tracemalloc snapshots) for default params and 350x350 draw place:
+# netGrowth, blocksGrowth - growth of traced memory (bytes) and of count of traced blocks after warm up frames
+# (cycle of animation must not accumulate anything), blocksPerFrame - max count of blocks, that one frame (step and paint)
+# leaves allocated (sum of positive differences of snapshot block counts by line of allocation)
+ALLOCATION_BUDGETS = {
+    'RoundRobin': {'netGrowth': 0, 'blocksGrowth': 0, 'blocksPerFrame': 150},
+    'RibbonDance': {'netGrowth': 0, 'blocksGrowth': 0, 'blocksPerFrame': 240},
+}
+
+# allocations of tracemalloc snapshots and of this module are not counted
+_SNAPSHOT_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+
+
+
+def _rss():
+    """Resident memory of process (bytes), None if it is unknown (not linux)."""
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _snapshot():
+    """Snapshot of traced blocks, without allocations of tracemalloc and of this module."""
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+def measureAllocations(animationType: str, framesCount: int = 3000, warmupFramesCount: int = 500, sampleInterval: int = 100,
+        windowSize: tuple = (350, 350)):
+    """ Allocations of long run of animation: framesCount frames (step and offscreen paint) under tracemalloc.
+        Snapshots are taken around every sampleInterval-th frame (snapshot takes milliseconds), at least 2 per run.
+
+        Returns dict: 'netGrowth' - growth of traced memory after warm up (bytes), 'blocksGrowth' - growth of count
+        of traced blocks, 'blocksPerFrame' - max count of blocks left by one frame, 'rssGrowth' - growth of resident memory.
+    """
+    if framesCount < 2:
+        raise ValueError("At least 2 frames are needed to measure growth, got {}".format(framesCount))
+    sampleInterval = max(1, min(sampleInterval, framesCount // 2))
+    app = _qApplication() # keep reference while running
+    drawPlace = _drawPlaceCreate(windowSize, (0, 0, 0), {'animationType': animationType})
+    image = QtGui.QImage(windowSize[0], windowSize[1], QtGui.QImage.Format_RGB32)
+
+    def frame():
+        next(drawPlace.worker)
+        drawPlace.render(image)
+
+    def sampledFrame():
+        """Frame between snapshots - returns (traced bytes, traced blocks) before frame and count of blocks left by frame."""
+        gc.collect()
+        beforeSnapshot = _snapshot()
+        frame()
+        differences = _snapshot().compare_to(beforeSnapshot, 'lineno')
+        return (sum(trace.size for trace in beforeSnapshot.traces), len(beforeSnapshot.traces)), \
+            sum(max(0, stat.count_diff) for stat in differences)
+
+    try:
+        tracemalloc.start()
+        try:
+            # warm up is traced too - one-time allocations of tracing and of first frames are not counted as growth
+            # and ends by sampled frame - first snapshots compile patterns of filters and change state of frame
+            for _ in range(warmupFramesCount):
+                frame()
+            sampledFrame()
+            startRss = _rss()
+
+            checkpoints = [] # (traced bytes, traced blocks) before sampled frames
+            blocksPerFrame = 0
+            for frameIdx in range(framesCount):
+                if frameIdx % sampleInterval:
+                    frame()
+                    continue
+                checkpoint, blocks = sampledFrame()
+                checkpoints.append(checkpoint)
+                blocksPerFrame = max(blocksPerFrame, blocks)
+            rss = _rss()
+        finally:
+            tracemalloc.stop()
+    finally:
+        drawPlace.worker.close()
+        drawPlace.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    # growth - of most common checkpoint from first to second half of run: objects, that are alive only between some
+    # frames (small int counters of generators, floats of damage limiter), change few checkpoints and are not counted,
+    # anything accumulated makes every checkpoint larger than previous
+    half = len(checkpoints) // 2
+    firstSize, firstCount = statistics.mode(checkpoints[:half])
+    secondSize, secondCount = statistics.mode(checkpoints[half:])
+    return {
+        'netGrowth': secondSize - firstSize,
+        'blocksGrowth': secondCount - firstCount,
+        'blocksPerFrame': blocksPerFrame,
+        'rssGrowth': rss - startRss if rss is not None and startRss is not None else None
+    }
+
+
+def checkRelease(animationType: str, stepsCount: int = 100):
+    """ Run LoadingScreen worker, stop it by 'exit' and check, that generators and Qt objects are released.
+
+        Returns dict: object name -> True if released.
+    """
+    app = _qApplication() # keep reference while running
+    screen = LoadingScreen(animationType=animationType)
+    worker = screen._worker()
+    for _ in range(stepsCount):
+        next(worker)
+        app.processEvents()
+
+    references = {
+        'worker': weakref.ref(worker),
+        'drawPlace.worker': weakref.ref(screen.ui.drawPlace.worker),
+        '_colorRainbowGeneratorInstance': weakref.ref(screen.ui.drawPlace._colorRainbowGeneratorInstance),
+        '_textGeneratorInstance': weakref.ref(screen._textGeneratorInstance),
+        'LoadingScreen': weakref.ref(screen),
+        'drawPlace': weakref.ref(screen.ui.drawPlace),
+        'textLabel': weakref.ref(screen.ui.textLabel),
+    }
+    qObjects = {'LoadingScreen (Qt)': screen, 'drawPlace (Qt)': screen.ui.drawPlace, 'textLabel (Qt)': screen.ui.textLabel}
+    qObjectsDeleted = {}
+
+    screen.exit = True
+    for _ in worker:
+        pass
+    app.processEvents() # close
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    for name, qObject in qObjects.items():
+        qObjectsDeleted[name] = sip.isdeleted(qObject)
+
+    del screen, worker, qObjects, qObject
+    gc.collect()
+
+    released = {name: reference() is None for name, reference in references.items()}
+    released.update(qObjectsDeleted)
+    return released
+
+
+
+def main(arguments: list = None):
+    """$ python -m pyLoadingScreen.leakcheck [--frames 3000] [--animations RoundRobin RibbonDance]"""
+    parser = argparse.ArgumentParser(prog="python -m pyLoadingScreen.leakcheck", description="Long run allocations and release check")
+    parser.add_argument('--frames', type=int, default=3000)
+    parser.add_argument('--animations', nargs='+', default=list(ANIMATION_TYPES))
+    arguments = parser.parse_args(arguments)
+
+    isFailed = False
+    for animationType in arguments.animations:
+        allocations = measureAllocations(animationType, arguments.frames)
+        budget = ALLOCATION_BUDGETS.get(animationType, {})
+        print("{} ({} frames):".format(animationType, arguments.frames))
+        for name, value in allocations.items():
+            line = "    {:<14} {}".format(name, value)
+            if name in budget:
+                isOverBudget = value > budget[name]
+                isFailed = isFailed or isOverBudget
+                line += "    budget {} - {}".format(budget[name], "OVER BUDGET" if isOverBudget else "ok")
+            print(line)
+
+        for name, isReleased in checkRelease(animationType).items():
+            isFailed = isFailed or not isReleased
+            print("    released {:<32} {}".format(name, "ok" if isReleased else "NOT RELEASED"))
+
+    return 1 if isFailed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+
+def blurImage(image: QtGui.QImage, radius: int):
+    """ Blurred copy of image (Format_RGB32) - 3 passes of box blur (close to gaussian).
+
+        With numpy - box blur is vectorized by running sums (cost does not depend on radius), without numpy -
+        smooth downscale and upscale by Qt. numpy is imported on first blur, not with module (import takes ~150 ms).
+    """
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    width, height = image.width(), image.height()
+    if radius < 1 or width == 0 or height == 0:
+        return image.copy()
+    if numpy is None:
+        small = image.scaled(max(1, width // radius), max(1, height // radius),
+            QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        return small.scaled(width, height, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    pixels = numpy.frombuffer(bits, numpy.uint8).reshape(height, image.bytesPerLine())[:, :width * 4]
+    pixels = pixels.reshape(height, width, 4).astype(numpy.float32)
+    for _ in range(3):
+        pixels = _boxBlur(pixels, radius, 0)
+        pixels = _boxBlur(pixels, radius, 1)
+
+    data = numpy.ascontiguousarray(pixels.round().clip(0, 255).astype(numpy.uint8))
+    return QtGui.QImage(data.data, width, height, width * 4, QtGui.QImage.Format_RGB32).copy() # copy - own memory
+
+
+def _boxBlur(pixels: object, radius: int, axis: int):
+    """Mean of 2 * radius + 1 pixels along axis by running sums, edges are repeated."""
+    import numpy
+    size = 2 * radius + 1
+    count = pixels.shape[axis]
+    padding = [(0, 0)] * pixels.ndim
+    padding[axis] = (radius + 1, radius) # + 1 - sum before first pixel is 0
+    sums = numpy.cumsum(numpy.pad(pixels, padding, mode='edge'), axis=axis, dtype=numpy.float32)
+
+    upper = [slice(None)] * pixels.ndim
+    lower = [slice(None)] * pixels.ndim
+    upper[axis] = slice(size, size + count)
+    lower[axis] = slice(0, count)
+    return (sums[tuple(upper)] - sums[tuple(lower)]) / size
+
+
+def overlaySnapshot(widget: QtWidgets.QWidget, dimming: float = 0.5, blurRadius: int = 0):
+    """ Snapshot of widget (with children) - grabbed once, blurred (blurRadius - logical pixels) and dimmed
+        (dimming - from 0 to 1, opacity of black). Returns QPixmap at native resolution.
+    """
+    pixmap = widget.grab()
+    devicePixelRatio = pixmap.devicePixelRatioF()
+    image = pixmap.toImage().convertToFormat(QtGui.QImage.Format_RGB32)
+    if blurRadius > 0:
+        image = blurImage(image, round(blurRadius * devicePixelRatio))
+    if dimming > 0:
+        painter = QtGui.QPainter(image)
+        painter.fillRect(image.rect(), QtGui.QColor(0, 0, 0, round(255 * min(dimming, 1))))
+        painter.end()
+
+    snapshot = QtGui.QPixmap.fromImage(image)
+    snapshot.setDevicePixelRatio(devicePixelRatio)
+    return snapshot
+
+
+
+class OverlayFilter(QtCore.QObject):
+    """ Event filter of covered widget, while overlay is shown over it:
+        paint events of widget and its children (except overlay) are suppressed - overlay shows snapshot instead,
+        overlay follows size of widget.
+    """
+    def __init__(self, overlay: QtWidgets.QWidget, covered: QtWidgets.QWidget):
+        """INIT."""
+        QtCore.QObject.__init__(self, overlay)
+        self.overlay = overlay
+        self.covered = covered
+        self.suppressedCount = 0
+        self._widgets = [covered] + [child for child in covered.findChildren(QtWidgets.QWidget)
+            if child is not overlay and not overlay.isAncestorOf(child)]
+
+
+    def install(self):
+        for widget in self._widgets:
+            widget.installEventFilter(self)
+
+
+    def remove(self):
+        """Stop suppression and repaint covered widget once."""
+        for widget in self._widgets:
+            try:
+                widget.removeEventFilter(self)
+            except RuntimeError: # widget is already deleted
+                pass
+        self._widgets = []
+        self.covered.update()
+
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent):
+        """QtCore.QObject.eventFilter"""
+        eventType = event.type()
+        if eventType == QtCore.QEvent.Paint:
+            self.suppressedCount += 1
+            return True
+        if eventType == QtCore.QEvent.Resize and watched is self.covered:
+            self.overlay.setGeometry(self.covered.rect())
+        return False
@@ -0,0 +1,179 @@
+import asyncio
+import functools
+import threading
+import contextvars
+from array import array
+from time import perf_counter_ns
+
+from pyLoadingScreen import tracer
+
+
+# not finished phases of current context (thread or asyncio task) - tuple of (timeline, index of phase), last is innermost.
+# One variable for all timelines, tuple - copies of context (new asyncio tasks) must not share stack
+_activePhases = contextvars.ContextVar("pyLoadingScreenActivePhases", default=())
+
+
+
+class PhaseTimeline:
+    """ Timeline of named loading phases - monotonic start / end times (perf_counter_ns) and nesting.
+
+        Phases are stored in flat arrays (start, end, index of parent) and list of names, in order of begin.
+        Begin and end of phase are few appends under lock - microseconds, so timeline can stay on in production.
+        Nesting is tracked per context (thread or asyncio task): phase begun inside other phase of same context is its child,
+        asyncio task is started with phases of context, that created it.
+    """
+    def __init__(self):
+        """INIT."""
+        self.names = []
+        self.starts = array('q')
+        self.ends = array('q') # -1 - phase is not finished
+        self.parents = array('l') # -1 - root phase
+        self.startTime = perf_counter_ns()
+        self._active = [] # indices of not finished phases (all threads), in order of begin
+        self._lock = threading.Lock()
+
+
+    def innermost(self):
+        """Index of innermost not finished phase of current context (thread or asyncio task), None - there are no such phases."""
+        for timeline, idx in reversed(_activePhases.get()):
+            if timeline is self:
+                return idx
+        return None
+
+
+    def begin(self, name: str):
+        """Begin of phase 'name'. Returns index of phase."""
+        stack = _activePhases.get()
+        parentIdx = self.innermost()
+        with self._lock:
+            idx = len(self.names)
+            self.names.append(name)
+            self.parents.append(parentIdx if parentIdx is not None else -1)
+            self.ends.append(-1)
+            self._active.append(idx)
+            self.starts.append(perf_counter_ns())
+        _activePhases.set(stack + ((self, idx),))
+        return idx
+
+
+    def end(self, idx: int):
+        """End of phase by its index."""
+        self.ends[idx] = perf_counter_ns()
+        stack = _activePhases.get()
+        if stack and stack[-1] == (self, idx):
+            _activePhases.set(stack[:-1])
+        elif (self, idx) in stack:
+            _activePhases.set(tuple(entry for entry in stack if entry != (self, idx)))
+        with self._lock:
+            self._active.remove(idx)
+
+
+    def current(self):
+        """Name of last begun not finished phase (of any thread), None - there are no running phases."""
+        active = self._active
+        return self.names[active[-1]] if active else None
+
+
+    def phases(self, endTime: int = None):
+        """ Phases in tree order (parent, then its children in order of begin):
+            list of (name, depth, start - ns since timeline start, duration - ns, self time - ns, isFinished).
+            Not finished phases last until endTime (default - now).
+        """
+        if endTime is None:
+            endTime = perf_counter_ns()
+        with self._lock:
+            count = len(self.names)
+            names, starts, ends, parents = self.names[:count], self.starts[:count], self.ends[:count], self.parents[:count]
+
+        children = [[] for _ in range(count)]
+        roots = []
+        durations = []
+        for idx in range(count):
+            (roots if parents[idx] < 0 else children[parents[idx]]).append(idx)
+            durations.append((ends[idx] if ends[idx] >= 0 else endTime) - starts[idx])
+
+        phases = []
+        stack = [(idx, 0) for idx in reversed(roots)]
+        while stack:
+            idx, depth = stack.pop()
+            selfTime = max(0, durations[idx] - sum(durations[childIdx] for childIdx in children[idx]))
+            phases.append((names[idx], depth, starts[idx] - self.startTime, durations[idx], selfTime, ends[idx] >= 0))
+            stack.extend((childIdx, depth + 1) for childIdx in reversed(children[idx]))
+        return phases
+
+
+    def table(self, endTime: int = None):
+        """Text table of phases durations (ms) - nested phases are indented, '%' - of time since timeline start."""
+        if endTime is None:
+            endTime = perf_counter_ns()
+        total = max(1, endTime - self.startTime)
+        lines = ["{:<40} {:>10} {:>12} {:>10} {:>6}".format("phase", "start, ms", "duration, ms", "self, ms", "%")]
+        for name, depth, start, duration, selfTime, isFinished in self.phases(endTime):
+            name = "  " * depth + name + ("" if isFinished else " (not finished)")
+            lines.append("{:<40} {:>10.1f} {:>12.1f} {:>10.1f} {:>6.1f}".format(
+                name, start / 1e6, duration / 1e6, selfTime / 1e6, duration / total * 100))
+        return "\n".join(lines)
+
+
+    def flame(self, endTime: int = None):
+        """ Flame-style breakdown - folded stacks "parent;child self time (us)" per line, summed by stack.
+
+            Can be rendered by flamegraph.pl or speedscope (www.speedscope.app).
+        """
+        stacks = {}
+        path = []
+        for name, depth, start, duration, selfTime, isFinished in self.phases(endTime):
+            del path[depth:]
+            path.append(name.replace(";", ","))
+            stack = ";".join(path)
+            stacks[stack] = stacks.get(stack, 0) + selfTime
+        return "\n".join("{} {}".format(stack, selfTime // 1000) for stack, selfTime in stacks.items())
+
+
+
+class Phase:
+    """ Named phase of timeline - context manager and decorator (of functions and coroutine functions), see LoadingScreen.phase.
+
+        onChange() - called after begin and end of phase (for example, to update label).
+    """
+    def __init__(self, timeline: PhaseTimeline, name: str, onChange: object = None):
+        """INIT."""
+        self.timeline = timeline
+        self.name = name
+        self._onChange = onChange
+
+
+    def __enter__(self):
+        recorder = tracer.recorder
+        if recorder is not None:
+            recorder.begin(self.name)
+        self.timeline.begin(self.name)
+        if self._onChange is not None:
+            self._onChange()
+        return self
+
+
+    def __exit__(self, excType: type, excValue: object, traceback: object):
+        # one phase instance can be entered many times (decorator of recursive function) and concurrently by threads
+        # and asyncio tasks - innermost phase of timeline in current context is this entry
+        self.timeline.end(self.timeline.innermost())
+        recorder = tracer.recorder
+        if recorder is not None:
+            recorder.end(self.name)
+        if self._onChange is not None:
+            self._onChange()
+        return False
+
+
+    def __call__(self, function: object):
+        if asyncio.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def wrapper(*args, **kwargs):
+                with self:
+                    return await function(*args, **kwargs)
+        else:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self:
+                    return function(*args, **kwargs)
+        return wrapper
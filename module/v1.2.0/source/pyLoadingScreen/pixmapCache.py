@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from PyQt5 import QtCore, QtGui
+
+
+
+class PixmapCache:
+    """ Pixmaps keyed by (key, logical size, devicePixelRatio) - rendered at native resolution of screen, so they are not
+        blurred on HiDPI screens and are not rescaled at every paint.
+
+        Missing pixmap (new size or window is moved to screen with other devicePixelRatio) is rendered lazily by zero timer
+        in GUI thread - 'get' returns None until then, and caller draws directly, so animation is not stalled by rebuild.
+        Least recently used pixmaps are dropped over maxCount.
+    """
+    def __init__(self, owner: QtCore.QObject, maxCount: int = 8):
+        """INIT."""
+        self.maxCount = maxCount
+        self._pixmaps = OrderedDict()
+        self._pending = {} # cache key -> render function
+
+        # timer is deleted with owner - pixmap of deleted widget is not rendered
+        self._timer = QtCore.QTimer(owner)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._renderPending)
+
+
+    def get(self, key: object, size: tuple, devicePixelRatio: float, render: object):
+        """ Cached pixmap or None (then pixmap is rendered later).
+
+            render(painter) - draws content in logical coordinates (from (0, 0) to size).
+        """
+        cacheKey = (key, size, devicePixelRatio)
+        pixmap = self._pixmaps.get(cacheKey)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(cacheKey)
+            return pixmap
+
+        if cacheKey not in self._pending:
+            self._pending[cacheKey] = render
+            self._timer.start()
+        return None
+
+
+    def _renderPending(self):
+        """Render requested pixmaps."""
+        pending = self._pending
+        self._pending = {}
+        for cacheKey, render in pending.items():
+            self._render(cacheKey, render)
+
+
+    def _render(self, cacheKey: tuple, render: object):
+        """Render pixmap at native resolution."""
+        key, (width, height), devicePixelRatio = cacheKey
+        if width <= 0 or height <= 0:
+            return
+
+        pixmap = QtGui.QPixmap(round(width * devicePixelRatio), round(height * devicePixelRatio))
+        pixmap.setDevicePixelRatio(devicePixelRatio)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        render(painter)
+        painter.end()
+
+        self._pixmaps[cacheKey] = pixmap
+        while len(self._pixmaps) > self.maxCount:
+            self._pixmaps.popitem(last=False)
+
+
+    def clear(self):
+        """Drop all pixmaps (content is changed)."""
+        self._pixmaps.clear()
+        self._pending.clear()
@@ -0,0 +1,1362 @@
+import sys
+import asyncio
+from math import exp, ceil
+from time import sleep, perf_counter, perf_counter_ns
+from itertools import count
+from threading import Thread
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from pyLoadingScreen import animations, frameCache, tracer
+from pyLoadingScreen.frameStore import FrameQueue
+from pyLoadingScreen.eta import EtaEstimator, formatDuration
+from pyLoadingScreen.runner import LoadingScreenRunner
+from pyLoadingScreen.phases import PhaseTimeline, Phase
+from pyLoadingScreen.importProgress import ImportProgressHook
+from pyLoadingScreen.remote import isRemoteSession, DamageLimiter
+from pyLoadingScreen.pixmapCache import PixmapCache
+from pyLoadingScreen.overlay import overlaySnapshot, OverlayFilter
+from pyLoadingScreen.animations import POINT_RECORD_SIZE, LINE_RECORD_SIZE, GRADIENT_LINEAR
+
+
+
+class LoadingScreen(QtWidgets.QFrame):
+    """ Loading screen by a.s.akulov.
+
+        Tested on python: 3.7.4, windows: x32, x64
+
+        LoadingScreen(PyQt5.QtWidgets.QFrame)
+
+        Params:
+            texts = ['Loading', 'Loading.', 'Loading..', 'Loading...'],
+            textUpdateDelay = 0.75,
+            textEtaFormat = None,                 # For example: "{text} (about {eta} remaining)"
+            textEtaWindow = 5,
+            textCountsFormat = "{text} ({completed}/{total})",
+
+            parentWidget = None,
+            windowSize = (350, 350),
+            mainStyleSheet = "background-color: black; color: rgb(80, 0, 255);",
+            mainFrameWidth = 3,
+            textLabelStyleSheet = "background-color: black; color: white; font: bold 18px;",
+
+            animationType = "RoundRobin",       # Animation types available: "RoundRobin", "RibbonDance" and registered by animations.registerAnimation
+            animationDetailСoefficient = 20,
+            animationRGBColor = (255, 0, 0),
+            animationColorRainbow = True,
+            animationColorRainbowStep = 2,
+            animationColorRainbowMinValues = (0, 0, 0),
+            animationColorRainbowMaxValues = (255, 255, 255),
+            animationLineWidth = 3,
+            animationScale = 0.95,
+            animationCountStepsPerRound = 1440,
+            animationRenderQuality = "High",     # Render quality tiers available: "High", "Medium", "Low", "Auto"
+            animationRenderQualityPaintBudget = 0.008,
+            animationFrameCacheDir = None,
+            animationFrameCacheMaxSize = 100 * 1024 * 1024,
+            animationTimeBasedPlayback = False,
+            animationProducerThread = False,
+            animationProducerLookahead = 8,
+            animationProgressSmoothing = 0.25,
+            animationRemoteMode = "Auto",       # True, False or "Auto" - by environment (SSH, remote DISPLAY, RDP, VNC)
+            animationRemoteFramesPerSecond = 10,
+            animationRemoteDamageBudget = 300000,
+
+            phasesReport = None,                # Report of phases at close: None, "table", "flame" (table and folded stacks)
+
+            importProgress = False,
+            importProgressFile = None,
+            importProgressReport = 10,
+
+            overlayParent = None,
+            overlayDimming = 0.5,
+            overlayBlurRadius = 0
+
+            Note:
+                1. I recommend running this in a new thread. Anyway, you need to create instance of LoadingScreen at main thread, then start worker function in any thread.
+                    If you want to start in new 'clear' thread - use 'worker' function, else if you wont to create task with asyncio - use 'worker_asyncio' coroutine.
+                    Variable with LoadingScreen instance must exist all time while script is running!
+
+                    - New thread start example:
+                    "self.screen = LoadingScreen()
+                     self.thread = threading.Thread(target=self.screen.worker)
+                     self.thread.start()"
+
+                    - Asyncio create task example:
+                    "self.screen = LoadingScreen()
+                     loop = asyncio.get_event_loop()
+                     asyncio.gather(self.screen.worker_async(), loop=loop)"
+                
+                2. To stop work use 'exit' attribute of LoadingScreen instance or create attribute '_exit' in 'worker' or 'worker_async' function.
+                    Work is stop after some time after signal to exit. You can check LoadingScreen instance state by 'isRunning' attribute.
+                    Example:
+                    "self.screen = LoadingScreen()
+                     self.thread = threading.Thread(target=self.screen.worker)
+                     self.thread.start()
+
+                     self.screen.exit = True
+                     self.screen.worker.__dict__['exit'] = True # Equivalent to 'self.screen.exit = True'
+                     self.screen.worker_async.__dict__['exit'] = True # Equivalent to 'self.screen.exit = True', but in this case - will not take any effect, because 'worker' is using insted ('self.thread = threading.Thread(target=self.screen.worker)')
+                     while True:
+                         time.sleep(1)
+                         if self.screen.isRunning:
+                             print('LoadingScreen is still running)
+                         else:
+                             print('LoadingScreen is not running)
+                             break"
+
+                3. If you set parentWidget - don't forget add LoadingScreen to parentWidget's layout!
+                    Example:
+                    "self.screen = LoadingScreen(parentWidget=self.ui.myParentWidget)
+                     myParentWidget.layout().addWidget(self.screen)"
+
+                4. If animationColorRainbow == True, then param 'animationRGBColor' ignored
+
+                5. If animationColorRainbow == False, then params ignored:
+                    animationColorRainbowStep,
+                    animationColorRainbowMinValues,
+                    animationColorRainbowMaxValues
+                
+                6. animationCountStepsPerRound - speed of rotation. animationCountStepsPerRound increases - rotation speed decreases
+
+                7. By some reason i can't create instance of LoadingScreen in Spyder (Anaconda, Python 3.7.4), but in outer program this work fine.
+
+                8. animationRenderQuality - tier controls antialiasing, gradients, points drawing and detail coefficient ("Low" tier uses half of animationDetailСoefficient).
+                    If animationRenderQuality == "Auto", then tier is stepped down when average paint time is over animationRenderQualityPaintBudget (seconds)
+                    and stepped back up when average paint time is less than half of budget.
+
+                9. If animationFrameCacheDir is set - cycle of animation frames is computed by background thread after first layout build
+                    and saved to this directory, and then (and on next runs with same params and size) frames are played from cache file
+                    (memory-mapped), without computation. Only periodic animations are cached; if cycle is longer than
+                    frameCacheMaxFramesCount of draw place (3000), only its first frames are cached - startup is played from cache.
+                    Every params and size have own file; total size of files in directory is limited by animationFrameCacheMaxSize
+                    (bytes, default 100 MB, None - without limit): when cache is saved, least recently used files (by modification time,
+                    it is updated when cache is opened) are removed, and cycle larger than limit is not saved.
+
+                10. If animationTimeBasedPlayback == True - animation step is selected by time since start (30 steps per second),
+                    so animation speed does not depend on delays of worker.
+
+                11. New animation types can be registered by 'pyLoadingScreen.animations.registerAnimation(name, layout, frame, period)'.
+                    layout(width, height, params) -> dict - values, that not depends on animation phase (cached per size and params),
+                    frame(phase, layout) -> animations.FrameBuffer - points and lines records of frame,
+                    period(layout) -> int or None - count of steps in cycle of periodic animation (None - not periodic).
+
+                12. If animationProducerThread == True - frames are computed ahead by background thread into queue of animationProducerLookahead frames,
+                    and GUI thread only takes ready frames and paints them. Producer waits while queue is full, frames that are late are dropped.
+                    Queue metrics (depth, depthAverage, droppedCount, underrunCount) are available as 'ui.drawPlace.frameQueue'.
+
+                13. Determinate mode - use 'setProgress(value)' (value from 0 to 1) from any thread: "RoundRobin" outer ring is filled by arc,
+                    "RibbonDance" sections light up from left to right. 'setProgress(None)' - back to indeterminate mode.
+                    Shown progress follows reported value smoothly (animationProgressSmoothing - time constant in seconds),
+                    so few progress updates per second look fluid.
+
+                14. If textEtaFormat is set - estimated remaining time of determinate mode is shown in label, for example:
+                    textEtaFormat = "{text} (about {eta} remaining)" -> "Loading.. (about 12 s remaining)".
+                    Throughput is exponentially weighted over textEtaWindow seconds, label is updated once per textUpdateDelay.
+                    Estimation is sampled by worker, so 'setProgress' cost is same with or without ETA.
+                    While progress is stalled (longer than textEtaWindow) or there is not enough history - only text is shown.
+
+                15. Instead of thread start and 'exit' - loading screen can be shown while work is running (in GUI thread):
+                    "with LoadingScreen.run(animationType="RibbonDance") as runner:
+                         result = runner.call(blockingFunction, arg)" # function is run in thread pool, GUI is not blocked
+                    "async with LoadingScreen.run() as runner:
+                         result = await coroutine(arg)" # animation is run by 'worker_async' at the same asyncio loop
+                    Or by decorator 'pyLoadingScreen.loading_screen(**params)' for functions and coroutine functions.
+                    Loading screen is closed right after work is finished, result and exception of work are passed through.
+
+                16. Many parallel tasks (concurrent.futures.Future or asyncio.Future / Task) can be tracked by one loading screen:
+                    "with LoadingScreen.run() as runner:
+                         results = runner.wait(executor.submit(load, path) for path in paths)"
+                    "async with LoadingScreen.run() as runner:
+                         results = await runner.wait_async(asyncio.ensure_future(load(path)) for path in paths)"
+                    Progress (determinate mode) and label (textCountsFormat) are driven by count of completed futures.
+                    Counts are updated by done-callbacks (without polling), loading screen is closed when all futures are done.
+
+                17. Loading can be profiled by named phases - 'phase(name)' is context manager and decorator, name of phase is shown in label:
+                    "with screen.phase("load models"):
+                         with screen.phase("read weights"):
+                             ..."
+                    "@screen.phase("connect")
+                     def connect(): ..."
+                    Start / end times (perf_counter_ns) and nesting (per thread and asyncio task) are recorded to 'timeline' (phases.PhaseTimeline),
+                    cost of phase is few microseconds. If phasesReport is set - table of phases durations ("flame" - and folded stacks
+                    for flamegraph.pl / speedscope) is printed to stderr when loading screen is closed. Phases are also recorded by tracer.
+
+                18. If importProgress == True - imports are counted and timed by sys.meta_path hook ('importHook') while loading screen is running.
+                    Module, that is being imported, is shown in label (not more often than 10 times per second). Count of imports is saved
+                    to importProgressFile (default - file of main script in temp directory), and on next runs progress (determinate mode)
+                    is estimated by it. When loading screen is closed, importProgressReport slowest imports (cumulative and self time)
+                    are printed to stderr - candidates to lazy import.
+
+                19. Low bandwidth mode for remote sessions (RDP, VNC, X forwarding) - animationRemoteMode: True, False or "Auto"
+                    (remote session is detected by SSH_CONNECTION, remote DISPLAY, RDP session name or "vnc" Qt platform).
+                    In this mode antialiasing, gradients and points are off ("Low" render quality), palette is reduced to 4 levels
+                    per channel, repaints are limited to animationRemoteFramesPerSecond and animationRemoteDamageBudget pixels per second.
+                    Estimated damaged pixels per second (any mode) - 'ui.drawPlace.damagedPixelsPerSecond'.
+
+                20. HiDPI screens: styled (not solid) background of draw place is cached as pixmap and label texts as QStaticText,
+                    keyed by logical size / text and devicePixelRatio, at native resolution. When window is moved to screen with other
+                    devicePixelRatio, pixmap is rebuilt lazily (background is drawn directly until then, animation is not stalled).
+                    Frames of animation are vector records in logical coordinates, so frame cache does not depend on devicePixelRatio.
+
+                21. Overlay mode - loading screen covers existing widget without layout changes:
+                    "screen = LoadingScreen(overlayParent=self.ui.tablePanel, overlayBlurRadius=4)"
+                    When loading screen is shown, overlayParent is grabbed once (QWidget.grab), blurred (overlayBlurRadius, vectorized
+                    by numpy if available) and dimmed (overlayDimming - opacity of black) once, and animation is painted over this image.
+                    Paint events of overlayParent and its children are suppressed until loading screen is hidden, then it is repainted once.
+                    windowSize, parentWidget and frame are not used in overlay mode; draw place and label backgrounds are transparent.
+        
+    """
+    class MyDrawingPlace(QtWidgets.QWidget):
+        signalMakeStep = QtCore.pyqtSignal()
+        signalUpdateDrawPlace = QtCore.pyqtSignal(QtCore.QRect)
+
+        # params, that layout depends on
+        _layoutParams = (
+            'animationType', 'detailСoefficient', 'color', 'colorRainbow', 'colorRainbowStep', 'colorRainbowMinValues',
+            'colorRainbowMaxValues', 'lineWidth', 'scale', 'countStepsPerRound', 'renderQualityTier'
+            )
+
+        # render quality tiers, from highest to lowest
+        renderQualityTiers = {
+            "HIGH": {'antialiasing': True, 'highQualityAntialiasing': True, 'gradients': True, 'points': True, 'detailСoefficient': 1},
+            "MEDIUM": {'antialiasing': True, 'highQualityAntialiasing': False, 'gradients': True, 'points': True, 'detailСoefficient': 0.75},
+            "LOW": {'antialiasing': False, 'highQualityAntialiasing': False, 'gradients': False, 'points': False, 'detailСoefficient': 0.5}
+        }
+
+        def __init__(self, main: object,
+                animationType = "RoundRobin",
+                detailСoefficient = 20,
+                color = (255, 0, 0),
+                colorRainbow = True,
+                colorRainbowStep = 2,
+                colorRainbowMinValues = (0, 0, 0),
+                colorRainbowMaxValues = (255, 255, 255),
+                lineWidth = 3,
+                scale = 0.95,
+                countStepsPerRound = 1440,
+                renderQuality = "High",
+                renderQualityPaintBudget = 0.008,
+                frameCacheDir = None,
+                frameCacheMaxFramesCount = 3000,
+                frameCacheMaxSize = 100 * 1024 * 1024,
+                timeBasedPlayback = False,
+                producerThread = False,
+                producerLookahead = 8,
+                progressSmoothing = 0.25,
+                remoteMode = "Auto",
+                remoteFramesPerSecond = 10,
+                remoteDamageBudget = 300000
+                ):
+            """INIT."""
+            QtWidgets.QWidget.__init__(self)
+            self._layoutVersions = count()
+            self._layoutVersion = next(self._layoutVersions)
+            self._pixmapCache = PixmapCache(self) # styled background at native resolution (by size and devicePixelRatio)
+
+            # window dragging - moves are coalesced to one per display refresh
+            self._dragPosition = None
+            self._dragMoveTime = 0
+            self._dragTimer = QtCore.QTimer(self)
+            self._dragTimer.setSingleShot(True)
+            self._dragTimer.setTimerType(QtCore.Qt.PreciseTimer)
+            self._dragTimer.timeout.connect(self._dragMove)
+
+            self.main = main
+            self.setParent(self.main)
+            self.worker = self._worker()
+            # bound methods (not lambda / built-in method) - PyQt keeps weak reference, widget is released after close
+            self.signalMakeStep.connect(self._makeStep)
+            self.signalUpdateDrawPlace.connect(self.update)
+
+            self.animationType = animationType
+            self.detailСoefficient = detailСoefficient
+            self.color = color
+            self.colorRainbow = colorRainbow
+            self.colorRainbowStep = colorRainbowStep
+            self.colorRainbowMinValues = colorRainbowMinValues
+            self.colorRainbowMaxValues = colorRainbowMaxValues
+            self.lineWidth = lineWidth
+            self.scale = scale
+            self.countStepsPerRound = countStepsPerRound # Rotation speed
+
+            # render quality
+            renderQuality = renderQuality.upper()
+            self.renderQualityAuto = renderQuality == "AUTO"
+            self.renderQualityPaintBudget = renderQualityPaintBudget # seconds
+            if renderQuality in self.renderQualityTiers:
+                self.renderQualityTier = renderQuality
+            else:
+                self.renderQualityTier = "HIGH"
+            self._paintTimeAverage = None
+            self._paintTimeFrames = 0
+
+            # low bandwidth mode for remote sessions (RDP, VNC, X forwarding): low render quality, reduced palette,
+            # repaints are limited by frame rate and damaged pixels per second
+            if isinstance(remoteMode, str):
+                remoteMode = isRemoteSession(platformName=QtGui.QGuiApplication.platformName())
+            self.remoteMode = remoteMode
+            if remoteMode:
+                self.renderQualityAuto = False
+                self.renderQualityTier = "LOW"
+                self.damageLimiter = DamageLimiter(remoteFramesPerSecond, remoteDamageBudget)
+            else:
+                self.damageLimiter = DamageLimiter() # only measures damaged pixels
+
+            # disk cache of frames
+            self.frameCacheDir = frameCacheDir
+            self.frameCacheMaxFramesCount = frameCacheMaxFramesCount
+            self.frameCacheMaxSize = frameCacheMaxSize # bytes, total size of cache directory
+
+            # if True - animation step is selected by time, else - step is made by every worker iteration
+            self.timeBasedPlayback = timeBasedPlayback
+            self.stepDuration = 333e-4 # seconds, 30 steps per second
+
+            # if True - frames are computed ahead by background thread
+            self.producerThread = producerThread
+            self.producerLookahead = producerLookahead
+            self.frameQueue = None
+
+            # determinate mode: progress from 0 to 1, None - indeterminate
+            self.progress = None
+            self.progressSmoothing = progressSmoothing # seconds
+            self._progressShown = None
+            self._progressTime = 0
+
+            self._colorRainbowGeneratorInstance = self._colorRainbowGenerator()
+
+            self._animation = None
+            self._period = None
+            self._frame = animations.FrameBuffer() # current frame - set by worker, painted by paintEvent (both at GUI thread)
+            self._frameCache = None
+            self._frameCacheBuilder = None
+            self._frameCacheParams = None
+
+            self._size = (self.width(), self.height())
+            self._layout = None
+            self._layoutBuiltVersion = None
+
+            self._previousFrameRect = QtCore.QRect()
+            self._isBackgroundSolid = False
+
+
+        def __setattr__(self, name: str, value: object):
+            """Drop cached layout when one of layout params is changed."""
+            QtWidgets.QWidget.__setattr__(self, name, value)
+            if name in self._layoutParams:
+                QtWidgets.QWidget.__setattr__(self, '_layoutVersion', next(self._layoutVersions))
+
+
+        def resizeEvent(self, event: object):
+            """QtWidgets.QWidget.resizeEvent"""
+            size = event.size()
+            self._size = (size.width(), size.height())
+            self._layoutVersion = next(self._layoutVersions)
+            QtWidgets.QWidget.resizeEvent(self, event)
+
+
+        def changeEvent(self, event: object):
+            """QtWidgets.QWidget.changeEvent"""
+            if event.type() in (QtCore.QEvent.StyleChange, QtCore.QEvent.PaletteChange):
+                self._updateOpaquePaint()
+                self._pixmapCache.clear()
+            QtWidgets.QWidget.changeEvent(self, event)
+
+
+        def _updateOpaquePaint(self):
+            """Enable opaque painting, if background is solid color - then paintEvent fills background by itself."""
+            styleSheet = self.styleSheet().lower()
+            backgroundColor = self.palette().color(QtGui.QPalette.Background)
+            self._isBackgroundSolid = backgroundColor.alpha() == 255 and not any(
+                word in styleSheet for word in ('gradient', 'image', 'border', 'url(')
+                )
+            self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, self._isBackgroundSolid)
+
+
+        @property
+        def damagedPixelsPerSecond(self):
+            """Estimated damaged (requested to repaint) pixels per second."""
+            return self.damageLimiter.pixelsPerSecondMeasured
+
+
+        def _qColor(self, r: float, g: float, b: float):
+            """Color of animation - in remote mode reduced palette (4 levels per channel), so color is changed rarely."""
+            if self.remoteMode:
+                r, g, b = round(r / 85) * 85, round(g / 85) * 85, round(b / 85) * 85
+            return QtGui.QColor(int(r), int(g), int(b))
+
+
+        def _detailСoefficient(self):
+            """Animation detail coefficient with current render quality tier."""
+            return max(3, round(self.detailСoefficient * self.renderQualityTiers[self.renderQualityTier]['detailСoefficient']))
+
+
+        def _renderQualityAdapt(self, paintTime: float):
+            """Auto render quality - step tier down if paint time is over budget, step up if there is headroom."""
+            if self._paintTimeAverage is None:
+                self._paintTimeAverage = paintTime
+            else:
+                self._paintTimeAverage += (paintTime - self._paintTimeAverage) * 0.1
+            self._paintTimeFrames += 1
+
+            # let average settle after tier switching
+            if self._paintTimeFrames < 30:
+                return
+
+            tiers = list(self.renderQualityTiers)
+            tierIdx = tiers.index(self.renderQualityTier)
+            if self._paintTimeAverage > self.renderQualityPaintBudget and tierIdx < len(tiers) - 1:
+                tierIdx += 1
+            elif self._paintTimeAverage < self.renderQualityPaintBudget / 2 and tierIdx > 0:
+                tierIdx -= 1
+            else:
+                return
+
+            self.renderQualityTier = tiers[tierIdx]
+            self._paintTimeAverage = None
+            self._paintTimeFrames = 0
+
+
+        def _layoutGet(self):
+            """ Cached layout for current widget size, rebuilt only after resize or params change.
+
+                Layout can be built in worker thread - if size or params are changed while layout is building,
+                then layout version is changed and layout is rebuilt at next call.
+            """
+            layoutVersion = self._layoutVersion
+            if self._layoutBuiltVersion != layoutVersion:
+                self._animation = animations.getAnimation(self.animationType)
+                params = self._animationParams()
+                layout = self._animation.layout(self._size[0], self._size[1], params)
+                self._period = self._animation.period(layout)
+                self._layout = layout
+                self._frameCacheOpen(params)
+                self._layoutBuiltVersion = layoutVersion
+            return self._layout
+
+
+        def mouseMoveEvent(self, event: object):
+            """QtWidgets.QWidget.mouseMoveEvent"""
+            if self.main.isMovingAllowed:
+                eventPos = event.globalPos()
+                widgetSize = self.main.size()
+                self._dragPosition = (eventPos.x() - widgetSize.width() / 2, eventPos.y() - widgetSize.height() / 2)
+
+                # high rate mice send hundreds of events per second - window is moved by latest position
+                # at once, if there was no move during display refresh interval, else - at end of interval
+                if not self._dragTimer.isActive():
+                    waitTime = self._dragMoveTime + self._dragInterval() - perf_counter()
+                    if waitTime <= 0:
+                        self._dragMove()
+                    else:
+                        self._dragTimer.start(max(1, round(waitTime * 1000)))
+
+
+        def _dragInterval(self):
+            """Display refresh interval (seconds) of screen with window."""
+            windowHandle = self.window().windowHandle()
+            screen = windowHandle.screen() if windowHandle is not None else QtGui.QGuiApplication.primaryScreen()
+            refreshRate = screen.refreshRate() if screen is not None else 0
+            return 1 / refreshRate if refreshRate > 0 else 1 / 60
+
+
+        def _dragMove(self):
+            """Move window by latest drag position."""
+            if self._dragPosition is not None:
+                self._dragMoveTime = perf_counter()
+                self.main.signalMove.emit(*self._dragPosition)
+                self._dragPosition = None
+
+
+        def paintEvent(self, event: object):
+            """QtWidgets.QWidget.paintEvent"""
+            recorder = tracer.recorder
+            if recorder is not None:
+                recorder.begin("paintEvent")
+            paintStartTime = perf_counter()
+            quality = self.renderQualityTiers[self.renderQualityTier]
+
+            painter = QtGui.QPainter(self)
+            painter.setRenderHint(painter.RenderHint.Antialiasing, quality['antialiasing'])
+            painter.setRenderHint(painter.RenderHint.HighQualityAntialiasing, quality['highQualityAntialiasing'])
+            painter.setRenderHint(painter.RenderHint.SmoothPixmapTransform, quality['highQualityAntialiasing'])
+
+            mainPalette = self.palette()
+            backgroundColor = mainPalette.color(mainPalette.Background)
+
+            # configure standart drawing
+            if self._isBackgroundSolid:
+                painter.fillRect(event.rect(), backgroundColor)
+            else:
+                # styled background - from cache, drawn directly until cached pixmap is rendered (after resize or screen change)
+                backgroundPixmap = self._pixmapCache.get('background', self._size, self.devicePixelRatioF(), self._backgroundRender)
+                if backgroundPixmap is not None:
+                    painter.drawPixmap(0, 0, backgroundPixmap)
+                else:
+                    self._backgroundRender(painter)
+
+            # start paint
+            if not self.colorRainbow:
+                color = self._qColor(*self.color)
+            else:
+                # generator is finished, if screen is closed, but paint event is still delivered
+                color = self._qColor(*next(self._colorRainbowGeneratorInstance, self.color))
+
+            pen = QtGui.QPen(
+                QtGui.QBrush(color),
+                self.lineWidth,
+                cap=QtCore.Qt.RoundCap,
+                join=QtCore.Qt.RoundJoin
+                )
+
+            # DRAW POINT
+            frame = self._frame
+            points = frame.points if quality['points'] else ()
+            for idx in range(0, len(points), POINT_RECORD_SIZE):
+                x, y, r, g, b, size = points[idx:idx + POINT_RECORD_SIZE]
+                if r >= 0 or size >= 0:
+                    colorLocal = self._qColor(r, g, b) if r >= 0 else color
+                    sizeLocal = size if size >= 0 else self.lineWidth
+
+                    painter.setPen(QtGui.QPen(
+                        QtGui.QBrush(colorLocal),
+                        sizeLocal,
+                        cap=QtCore.Qt.RoundCap,
+                        join=QtCore.Qt.RoundJoin
+                        ))
+                else:
+                    painter.setPen(pen)
+                painter.drawPoint(QtCore.QPointF(x, y))
+
+            # DRAW LINE
+            lines = frame.lines
+            for idx in range(0, len(lines), LINE_RECORD_SIZE):
+                x1, y1, x2, y2, r, g, b, width, gradientType, gradientReverse = lines[idx:idx + LINE_RECORD_SIZE]
+                if r >= 0 or width >= 0 or gradientType:
+                    colorLocal = self._qColor(r, g, b) if r >= 0 else color
+                    widthLocal = width if width >= 0 else self.lineWidth
+
+                    if gradientType == GRADIENT_LINEAR and quality['gradients']:
+                        gradient = QtGui.QLinearGradient(QtCore.QPointF(x1, y1), QtCore.QPointF(x2, y2))
+                        if not gradientReverse:
+                            gradient.setColorAt(0, colorLocal)
+                            gradient.setColorAt(1, backgroundColor)
+                        else:
+                            gradient.setColorAt(1, colorLocal)
+                            gradient.setColorAt(0, backgroundColor)
+                        brushLocal = QtGui.QBrush(gradient)
+                    else:
+                        brushLocal = QtGui.QBrush(colorLocal)
+
+                    painter.setPen(QtGui.QPen(
+                        brushLocal,
+                        widthLocal,
+                        cap=QtCore.Qt.RoundCap,
+                        join=QtCore.Qt.RoundJoin
+                        ))
+
+                else:
+                    painter.setPen(pen)
+                painter.drawLine(QtCore.QLineF(x1, y1, x2, y2))
+
+            # end paint
+            painter.end()
+
+            if self.renderQualityAuto:
+                self._renderQualityAdapt(perf_counter() - paintStartTime)
+            if recorder is not None:
+                recorder.end("paintEvent")
+
+        def _backgroundRender(self, painter: QtGui.QPainter):
+            """Draw styled background of widget."""
+            styleOption = QtWidgets.QStyleOption()
+            styleOption.initFrom(self)
+            self.style().drawPrimitive(QtWidgets.QStyle.PE_Widget, styleOption, painter, self)
+
+
+        def _animationParams(self):
+            """Params of animation for layout (see animations.DEFAULT_PARAMS)."""
+            return {
+                'detailСoefficient': self._detailСoefficient(),
+                'color': self.color,
+                'colorRainbow': self.colorRainbow,
+                'colorRainbowStep': self.colorRainbowStep,
+                'colorRainbowMinValues': self.colorRainbowMinValues,
+                'colorRainbowMaxValues': self.colorRainbowMaxValues,
+                'lineWidth': self.lineWidth,
+                'scale': self.scale,
+                'countStepsPerRound': self.countStepsPerRound
+            }
+
+
+        def _frameCacheOpen(self, params: dict):
+            """Open disk frame cache for current layout, or start background building of it."""
+            if self._frameCacheBuilder is not None:
+                self._frameCacheBuilder.cancel()
+                self._frameCacheBuilder = None
+            if self._frameCache is not None:
+                self._frameCache.close()
+            self._frameCache = None
+
+            # only periodic animations are cached, long cycle - only first frames
+            if self.frameCacheDir is None or self._period is None:
+                return
+            framesCount = min(self._period, self.frameCacheMaxFramesCount)
+
+            self._frameCacheParams = (self._animation.name, self._size, tuple(sorted(params.items())))
+            cache = frameCache.FrameCache.open(self.frameCacheDir, self._frameCacheParams)
+            if cache is not None and len(cache) == framesCount:
+                self._frameCache = cache
+            else:
+                if cache is not None:
+                    cache.close()
+                self._frameCacheBuilder = frameCache.FrameCacheBuilder(
+                    self.frameCacheDir, self._frameCacheParams, self._animation.frame, self._layout, framesCount,
+                    self.frameCacheMaxSize)
+                self._frameCacheBuilder.start()
+
+
+        def _frameGet(self, phase: int):
+            """Frame of animation for step 'phase' - from disk frame cache, or computed."""
+            layout = self._layoutGet()
+            if self._period is not None:
+                phase %= self._period
+
+            # cache is built - play frames from it
+            builder = self._frameCacheBuilder
+            if builder is not None and not builder.is_alive():
+                self._frameCacheBuilder = None
+                if builder.path is not None:
+                    self._frameCache = frameCache.FrameCache.open(self.frameCacheDir, self._frameCacheParams)
+
+            if self._frameCache is not None and phase < len(self._frameCache):
+                return self._frameCache.frame(phase)
+            return self._animation.frame(phase, layout)
+
+
+        def _makeStep(self):
+            """Step of animation (by signalMakeStep). Steps queued before close of screen are skipped."""
+            next(self.worker, None)
+
+
+        def _worker(self):
+            """Main worker."""
+            producer = None
+            if self.producerThread:
+                self.frameQueue = FrameQueue(self.producerLookahead)
+                producer = Thread(target=self._producer, args=(self.frameQueue,), name="pyLoadingScreenFrameProducer", daemon=True)
+                producer.start()
+
+            phase = 0
+            startTime = perf_counter()
+            animationFrame = None
+            animationSource = None
+            try:
+                while True:
+                    recorder = tracer.recorder
+                    if recorder is not None:
+                        recorder.begin("animation step")
+                    if self.timeBasedPlayback:
+                        phase = int((perf_counter() - startTime) / self.stepDuration)
+
+                    if producer is None:
+                        frame = self._frameGet(phase)
+                        frameRect = self._frameRect(frame)
+                        frameSource = (self._animation, self._layout)
+                    else:
+                        # layout is built only by producer - animation and layout of frame come with it
+                        frame, frameRect, frameSource = self.frameQueue.pop(phase, self._layoutVersion) or (None, None, None)
+
+                    # determinate mode - progress is drawn over frame of animation on every step
+                    if frame is not None:
+                        animationFrame = frame
+                        animationSource = frameSource
+                    progress = self._progressShownGet()
+                    if progress is not None and animationFrame is not None:
+                        animation, layout = animationSource
+                        frame = animation.progressFrame(animationFrame, progress, layout)
+                        frameRect = self._frameRect(frame)
+
+                    if frame is not None:
+                        self._frame = frame
+
+                        # repaint only area of previous and current frames (if damage limiter allows)
+                        updateRect = frameRect.united(self._previousFrameRect)
+                        if self.damageLimiter.allow(updateRect.width() * updateRect.height()):
+                            self.signalUpdateDrawPlace.emit(updateRect)
+                            self._previousFrameRect = frameRect
+                    if recorder is not None:
+                        recorder.end("animation step")
+                    yield
+
+                    phase += 1
+
+            finally:
+                if producer is not None:
+                    self.frameQueue.close()
+                    producer.join()
+                if self._frameCache is not None:
+                    self._frameCache.close()
+                    self._frameCache = None
+
+
+        def _progressShownGet(self):
+            """ Shown progress - follows 'progress' smoothly by time (exponential easing with progressSmoothing time constant),
+                so rare progress updates look fluid. None - indeterminate mode.
+            """
+            progress = self.progress
+            currentTime = perf_counter()
+            if progress is None:
+                self._progressShown = None
+            elif self._progressShown is None or progress < self._progressShown or self.progressSmoothing <= 0:
+                # first value or progress restart - without easing
+                self._progressShown = progress
+            else:
+                self._progressShown += (progress - self._progressShown) * (1 - exp((self._progressTime - currentTime) / self.progressSmoothing))
+            self._progressTime = currentTime
+            return self._progressShown
+
+
+        def _producer(self, frameQueue: FrameQueue):
+            """Producer thread - computes frames ahead of worker, until queue is closed."""
+            phase = 0
+            producedLayoutVersion = None
+            while not frameQueue.isClosed:
+                layoutVersion = self._layoutVersion
+                if layoutVersion != producedLayoutVersion:
+                    # frames of previous layout are dropped - start again from current phase of consumer
+                    phase = frameQueue.consumerPhase
+                    producedLayoutVersion = layoutVersion
+                else:
+                    # consumer is ahead - skip frames, that are already stale
+                    phase = max(phase, frameQueue.consumerPhase)
+                recorder = tracer.recorder
+                if recorder is not None:
+                    recorder.begin("produce frame")
+                frame = self._frameGet(phase)
+                frameRect = self._frameRect(frame)
+                if recorder is not None:
+                    recorder.end("produce frame")
+                if not frameQueue.put(phase, layoutVersion, frame, frameRect, (self._animation, self._layout)):
+                    break
+                phase += 1
+
+
+        def _frameRect(self, frame: animations.FrameBuffer):
+            """Bounding rectangle of frame points and lines, including pen width."""
+            bounds = frame.bounds(self.lineWidth)
+            if bounds is None:
+                return QtCore.QRect()
+
+            (left, top, right, bottom), width = bounds
+            margin = width / 2 + 2 # round caps + antialiasing
+            return QtCore.QRectF(
+                QtCore.QPointF(left - margin, top - margin),
+                QtCore.QPointF(right + margin, bottom + margin)
+                ).toAlignedRect()
+
+
+        def _colorRainbowGenerator(self, oneRound=False):
+            """Generating color for color rainbow."""
+            return animations.colorRainbowGenerator(self.colorRainbowStep, self.colorRainbowMinValues, self.colorRainbowMaxValues, oneRound)
+
+
+
+
+    class MyTextLabel(QtWidgets.QLabel):
+        """ Text label (QLabel), plain text is drawn by cached QStaticText (one per unique text).
+
+            Height is fixed by font, so changing text only repaints label. Plain text is kept by label itself - QLabel.setText
+            always requests relayout of parent layout. Same text is not set again.
+            Rich text, word wrap, pixmap and movie are drawn by QLabel as usual.
+        """
+        staticTextsCacheSize = 256
+
+        def __init__(self, parent: object = None):
+            """INIT."""
+            QtWidgets.QLabel.__init__(self, parent)
+            self.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Fixed)
+            self._staticTexts = {}
+            self._plainText = None # text drawn by QStaticText, None - text is kept by QLabel
+
+
+        def text(self):
+            """QtWidgets.QLabel.text"""
+            return self._plainText if self._plainText is not None else QtWidgets.QLabel.text(self)
+
+
+        def setText(self, text: str):
+            """QtWidgets.QLabel.setText"""
+            if text == self.text():
+                return
+            if self._isStaticText(text):
+                if self._plainText is None and QtWidgets.QLabel.text(self):
+                    QtWidgets.QLabel.clear(self)
+                self._plainText = text
+                self.update()
+            else:
+                self._plainText = None
+                QtWidgets.QLabel.setText(self, text)
+
+
+        def _plainTextRelease(self):
+            """Text is passed to QLabel, if label is not plain text in one line anymore (word wrap or rich text format)."""
+            if self._plainText is not None and not self._isStaticText(self._plainText):
+                text, self._plainText = self._plainText, None
+                QtWidgets.QLabel.setText(self, text)
+
+
+        def setWordWrap(self, on: bool):
+            """QtWidgets.QLabel.setWordWrap"""
+            QtWidgets.QLabel.setWordWrap(self, on)
+            self._plainTextRelease()
+
+
+        def setTextFormat(self, textFormat: object):
+            """QtWidgets.QLabel.setTextFormat"""
+            QtWidgets.QLabel.setTextFormat(self, textFormat)
+            self._plainTextRelease()
+
+
+        def setPixmap(self, pixmap: object):
+            """QtWidgets.QLabel.setPixmap"""
+            self._plainText = None
+            QtWidgets.QLabel.setPixmap(self, pixmap)
+
+
+        def setMovie(self, movie: object):
+            """QtWidgets.QLabel.setMovie"""
+            self._plainText = None
+            QtWidgets.QLabel.setMovie(self, movie)
+
+
+        def setPicture(self, picture: object):
+            """QtWidgets.QLabel.setPicture"""
+            self._plainText = None
+            QtWidgets.QLabel.setPicture(self, picture)
+
+
+        def setNum(self, number: object):
+            """QtWidgets.QLabel.setNum"""
+            self.setText(str(number) if isinstance(number, int) else "{:g}".format(number)) # as QString.number
+
+
+        def clear(self):
+            """QtWidgets.QLabel.clear"""
+            self._plainText = None
+            QtWidgets.QLabel.clear(self)
+            self.update()
+
+
+        def _isStaticText(self, text: str = None):
+            """True if label shows (or would show) only plain text in one line - it is drawn by QStaticText."""
+            if text is None:
+                text = self.text()
+            textFormat = self.textFormat()
+            return self.pixmap() is None and self.movie() is None and self.picture() is None and not self.wordWrap() \
+                and (textFormat == QtCore.Qt.PlainText or (textFormat == QtCore.Qt.AutoText and not QtCore.Qt.mightBeRichText(text)))
+
+
+        def changeEvent(self, event: object):
+            """QtWidgets.QWidget.changeEvent"""
+            if event.type() in (QtCore.QEvent.FontChange, QtCore.QEvent.StyleChange):
+                self._staticTexts.clear()
+                self.setFixedHeight(self.fontMetrics().height() + 2 * self.frameWidth())
+            QtWidgets.QLabel.changeEvent(self, event)
+
+
+        def sizeHint(self):
+            """QtWidgets.QLabel.sizeHint"""
+            if not self._isStaticText():
+                return QtWidgets.QLabel.sizeHint(self)
+            frameWidth = 2 * self.frameWidth()
+            return QtCore.QSize(
+                ceil(self._staticText(self.text()).size().width()) + frameWidth, self.fontMetrics().height() + frameWidth)
+
+
+        def minimumSizeHint(self):
+            """QtWidgets.QLabel.minimumSizeHint"""
+            if not self._isStaticText():
+                return QtWidgets.QLabel.minimumSizeHint(self)
+            return self.sizeHint()
+
+
+        def _staticText(self, text: str):
+            """ Cached QStaticText of text - layout of glyphs is prepared once per devicePixelRatio (at native resolution
+                of screen), so text is not laid out again at every paint on HiDPI screens.
+            """
+            devicePixelRatio = self.devicePixelRatioF()
+            key = (text, devicePixelRatio)
+            staticText = self._staticTexts.get(key)
+            if staticText is None:
+                if len(self._staticTexts) >= self.staticTextsCacheSize:
+                    del self._staticTexts[next(iter(self._staticTexts))] # oldest text
+                staticText = QtGui.QStaticText(text)
+                staticText.setTextFormat(QtCore.Qt.PlainText)
+                staticText.prepare(QtGui.QTransform.fromScale(devicePixelRatio, devicePixelRatio), self.font())
+                self._staticTexts[key] = staticText
+            return staticText
+
+
+        def paintEvent(self, event: object):
+            """QtWidgets.QLabel.paintEvent"""
+            if not self._isStaticText():
+                QtWidgets.QLabel.paintEvent(self, event)
+                return
+
+            recorder = tracer.recorder
+            if recorder is not None:
+                recorder.begin("label paintEvent")
+            painter = QtGui.QPainter(self)
+            self.drawFrame(painter)
+
+            text = self.text()
+            if text:
+                staticText = self._staticText(text)
+                textSize = staticText.size()
+                rect = self.contentsRect()
+                alignment = self.alignment()
+                if alignment & QtCore.Qt.AlignHCenter:
+                    x = rect.x() + (rect.width() - textSize.width()) / 2
+                elif alignment & QtCore.Qt.AlignRight:
+                    x = rect.right() + 1 - textSize.width()
+                else:
+                    x = rect.x()
+                if alignment & QtCore.Qt.AlignTop:
+                    y = rect.y()
+                elif alignment & QtCore.Qt.AlignBottom:
+                    y = rect.bottom() + 1 - textSize.height()
+                else:
+                    y = rect.y() + (rect.height() - textSize.height()) / 2
+                painter.setFont(self.font())
+                painter.setPen(self.palette().color(self.foregroundRole()))
+                painter.drawStaticText(QtCore.QPointF(x, y), staticText)
+            painter.end()
+            if recorder is not None:
+                recorder.end("label paintEvent")
+
+
+
+
+    signalShow = QtCore.pyqtSignal()
+    signalClose = QtCore.pyqtSignal()
+    signalSetLabelText = QtCore.pyqtSignal(str)
+    signalMove = QtCore.pyqtSignal(float, float)
+
+    def __init__(self, 
+            texts = ['Loading', 'Loading.', 'Loading..', 'Loading...'],
+            textUpdateDelay = 0.75,
+            textEtaFormat = None,
+            textEtaWindow = 5,
+            textCountsFormat = "{text} ({completed}/{total})",
+
+            parentWidget = None,
+            windowSize = (350, 350),
+            mainStyleSheet = "background-color: black; color: rgb(80, 0, 255);",
+            mainFrameWidth = 3,
+            textLabelStyleSheet = "background-color: black; color: white; font: bold 18px;",
+
+            animationType = "RoundRobin",
+            animationDetailСoefficient = 20,
+            animationRGBColor = (255, 0, 0),
+            animationColorRainbow = True,
+            animationColorRainbowStep = 2,
+            animationColorRainbowMinValues = (0, 0, 0),
+            animationColorRainbowMaxValues = (255, 255, 255),
+            animationLineWidth = 3,
+            animationScale = 0.95,
+            animationCountStepsPerRound = 1440,
+            animationRenderQuality = "High",
+            animationRenderQualityPaintBudget = 0.008,
+            animationFrameCacheDir = None,
+            animationFrameCacheMaxSize = 100 * 1024 * 1024,
+            animationTimeBasedPlayback = False,
+            animationProducerThread = False,
+            animationProducerLookahead = 8,
+            animationProgressSmoothing = 0.25,
+            animationRemoteMode = "Auto",
+            animationRemoteFramesPerSecond = 10,
+            animationRemoteDamageBudget = 300000,
+
+            phasesReport = None,
+
+            importProgress = False,
+            importProgressFile = None,
+            importProgressReport = 10,
+
+            overlayParent = None,
+            overlayDimming = 0.5,
+            overlayBlurRadius = 0,
+            ):
+        """INIT."""
+        ################## GUI
+        QtWidgets.QFrame.__init__(self)
+        self.ui = QtCore.QObject()
+        self.overlayParent = overlayParent
+        self.overlayDimming = overlayDimming
+        self.overlayBlurRadius = overlayBlurRadius
+        self._overlaySnapshot = None
+        self._overlayFilter = None
+        if overlayParent is not None:
+            # over snapshot of overlayParent, not in its layout
+            self.setParent(overlayParent)
+            self.setGeometry(overlayParent.rect())
+            self.isMovingAllowed = False
+            mainStyleSheet += " background-color: transparent;"
+            textLabelStyleSheet += " background-color: transparent;"
+        elif parentWidget != None:
+            self.setParent(parentWidget)
+            self.setMinimumSize(*windowSize)
+            self.setMaximumSize(*windowSize)
+            self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+            self.isMovingAllowed = False
+        else:
+            self.resize(*windowSize)
+            self.isMovingAllowed = True
+
+        self.setObjectName("LoadingScreenMainWindow")
+        self.setFrameShape(self.Box if overlayParent is None else self.NoFrame)
+        self.setLineWidth(mainFrameWidth)
+        self.setStyleSheet(mainStyleSheet)
+
+        self.setWindowFlags(QtCore.Qt.FramelessWindowHint)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, overlayParent is not None) # snapshot covers whole overlay
+
+        self.signalShow.connect(self._show)
+        self.signalClose.connect(self._close)
+        self.signalMove.connect(self._move)
+
+            # main layout
+        self.ui.verticalLayout = QtWidgets.QVBoxLayout(self)
+        self.ui.verticalLayout.setObjectName("verticalLayout")
+        self.ui.verticalLayout.setContentsMargins(0, 0, 0, 6)
+        self.ui.verticalLayout.setSpacing(0)
+
+            # draw place
+        self.ui.drawPlace = self.MyDrawingPlace(self,
+            animationType=animationType,
+            detailСoefficient=animationDetailСoefficient,
+            color=animationRGBColor,
+            colorRainbow=animationColorRainbow,
+            colorRainbowStep=animationColorRainbowStep,
+            colorRainbowMinValues=animationColorRainbowMinValues,
+            colorRainbowMaxValues=animationColorRainbowMaxValues,
+            lineWidth=animationLineWidth,
+            scale=animationScale,
+            countStepsPerRound=animationCountStepsPerRound,
+            renderQuality=animationRenderQuality,
+            renderQualityPaintBudget=animationRenderQualityPaintBudget,
+            frameCacheDir=animationFrameCacheDir,
+            frameCacheMaxSize=animationFrameCacheMaxSize,
+            timeBasedPlayback=animationTimeBasedPlayback,
+            producerThread=animationProducerThread,
+            producerLookahead=animationProducerLookahead,
+            progressSmoothing=animationProgressSmoothing,
+            remoteMode=animationRemoteMode,
+            remoteFramesPerSecond=animationRemoteFramesPerSecond,
+            remoteDamageBudget=animationRemoteDamageBudget
+            )
+        self.ui.drawPlace.setObjectName("drawPlace")
+        self.ui.drawPlace.setStyleSheet(mainStyleSheet)
+        self.ui.verticalLayout.addWidget(self.ui.drawPlace)
+            # text label
+        self.ui.textLabel = self.MyTextLabel(self)
+        self.ui.textLabel.setObjectName("textLabel")
+        self.ui.textLabel.setStyleSheet(textLabelStyleSheet)
+        self.ui.textLabel.setAlignment(QtCore.Qt.AlignHCenter)
+        self.signalSetLabelText.connect(self.ui.textLabel.setText)
+        self.ui.verticalLayout.addWidget(self.ui.textLabel)
+
+            # other
+        self.ui.verticalLayout.setStretch(0, 1)
+        ################## OTHER
+        self.texts = texts
+        self.textUpdateDelay = textUpdateDelay
+        self.textEtaFormat = textEtaFormat
+        self.etaEstimator = EtaEstimator(textEtaWindow)
+        self.textCountsFormat = textCountsFormat
+        self.futuresCounter = None # set by LoadingScreenRunner.wait
+        self.timeline = PhaseTimeline()
+        self.phasesReport = phasesReport
+        self.importHook = ImportProgressHook(importProgressFile) if importProgress else None
+        self.importProgressReport = importProgressReport
+
+        self.exit = False
+        self.isRunning = False
+        self._isWorkerFinished = False # window is deleted on close - only after worker, that emits signals of screen
+        self._textGeneratorInstance = self._textGenerator()
+        self._labelTextCurrent = None
+        self._textCurrent = None # current text of 'texts'
+        self._importLabelTime = 0
+
+        self._window = None
+        self._delayTimer = 0
+        self._iterationDelay = 333e-4 # 30 frames per second
+    
+
+    def setProgress(self, progress: float = None):
+        """Set progress of determinate mode (from 0 to 1), None - indeterminate mode. Can be called from any thread."""
+        if progress is not None:
+            progress = min(max(float(progress), 0.0), 1.0)
+        self.ui.drawPlace.progress = progress
+
+
+    def phase(self, name: str):
+        """ Named phase of loading - context manager and decorator, phase name is shown in label while phase is running.
+
+            "with screen.phase("load models"): ..." or "@screen.phase("load models")". Can be used from any thread.
+        """
+        return Phase(self.timeline, name, self._phaseChanged)
+
+
+    @classmethod
+    def run(cls, executor: object = None, **params):
+        """ Context manager - loading screen (with LoadingScreen params) is shown while block is running.
+
+            "with LoadingScreen.run() as runner:
+                 result = runner.call(blockingFunction, arg)"
+            "async with LoadingScreen.run() as runner:
+                 result = await coroutine(arg)"
+            executor - concurrent.futures executor for 'call', default - own thread pool. See LoadingScreenRunner.
+        """
+        return LoadingScreenRunner(cls, params, executor)
+
+
+    def _labelTextSet(self, text: str):
+        """Set label text - signal is emitted only if text is changed."""
+        if text == self._labelTextCurrent:
+            return
+        self._labelTextCurrent = text
+        if tracer.recorder is not None:
+            tracer.recorder.instant("label text")
+        self.signalSetLabelText.emit(text)
+
+
+    def _labelTextBase(self):
+        """Text of label - name of running phase, module that is being imported or current text of 'texts'."""
+        text = self.timeline.current()
+        if text is None and self.importHook is not None:
+            text = self.importHook.current
+        return text or self._textCurrent
+
+
+    def _phaseChanged(self):
+        """Phase is begun or ended - label shows current phase (or text of 'texts' if there are no running phases)."""
+        text = self._labelTextBase()
+        if text is not None:
+            self._labelTextSet(self._labelText(text))
+
+
+    def _importProgressUpdate(self):
+        """Progress and label by import hook."""
+        progress = self.importHook.progress
+        if progress is not None:
+            self.setProgress(progress)
+
+        currentTime = perf_counter()
+        if self.importHook.current is not None and currentTime - self._importLabelTime >= self.importHook.labelDelay:
+            self._importLabelTime = currentTime
+            self._labelTextSet(self._labelText(self._labelTextBase()))
+
+
+    def _importProgressFinish(self):
+        """Remove import hook, save count of imports and print slowest imports (see importProgressReport)."""
+        self.importHook.uninstall()
+        self.importHook.save()
+        if self.importProgressReport:
+            print(self.importHook.report(self.importProgressReport), file=sys.stderr)
+
+
+    def _phasesReportPrint(self):
+        """Print report of phases (see phasesReport)."""
+        if self.phasesReport is None or not self.timeline.names:
+            return
+        endTime = perf_counter_ns()
+        report = self.timeline.table(endTime)
+        if self.phasesReport == "flame":
+            report += "\n\n" + self.timeline.flame(endTime)
+        print(report, file=sys.stderr)
+
+
+    def _labelText(self, text: str):
+        """Label text with counts of tracked futures and estimated remaining time (if they are enabled and known)."""
+        if self.futuresCounter is not None and self.textCountsFormat is not None:
+            text = self.textCountsFormat.format(text=text, completed=self.futuresCounter.completed, total=self.futuresCounter.total)
+
+        if self.textEtaFormat is None or self.ui.drawPlace.progress is None:
+            return text
+        remaining = self.etaEstimator.remaining()
+        if remaining is None:
+            return text
+        return self.textEtaFormat.format(text=text, eta=formatDuration(remaining))
+
+
+    def _textGenerator(self):
+        """Generator for self.texts."""
+        while True:
+            for text in self.texts:
+                yield text
+
+
+    def _move(self, x: float, y: float):
+        """Move window (by signalMove)."""
+        self.move(int(x), int(y))
+
+
+    def _show(self):
+        """Show loading screen (by signalShow). Overlay mode - snapshot of overlayParent is taken and its painting is suppressed."""
+        if self.exit: # signal is delivered after screen is closed
+            return
+        if self.overlayParent is not None and self._overlayFilter is None:
+            self._overlaySnapshot = overlaySnapshot(self.overlayParent, self.overlayDimming, self.overlayBlurRadius)
+            self._overlayFilter = OverlayFilter(self, self.overlayParent)
+            self._overlayFilter.install()
+            self.setGeometry(self.overlayParent.rect())
+            self.raise_()
+        self.show()
+
+
+    def _close(self):
+        """ Close loading screen (by signalClose or by runner) - in GUI thread, so generators of draw place are closed after
+            window is hidden and not while they are used by its steps and paint events. Window is deleted (WA_DeleteOnClose),
+            when worker is finished - until then worker can emit signals of screen.
+        """
+        self.exit = True
+        self.hide()
+        self.ui.drawPlace.worker.close()
+        self.ui.drawPlace._colorRainbowGeneratorInstance.close()
+        if self._isWorkerFinished:
+            self.close()
+
+
+    def hideEvent(self, event: object):
+        """QtWidgets.QWidget.hideEvent"""
+        if self._overlayFilter is not None:
+            self._overlayFilter.remove()
+            self._overlayFilter = None
+            self._overlaySnapshot = None
+        QtWidgets.QFrame.hideEvent(self, event)
+
+
+    def paintEvent(self, event: object):
+        """QtWidgets.QFrame.paintEvent"""
+        if self._overlaySnapshot is None:
+            QtWidgets.QFrame.paintEvent(self, event)
+            return
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(self.rect(), self._overlaySnapshot)
+        painter.end()
+
+
+    def _gui_create(self):
+        """Create window for loading screen."""
+        self.signalShow.emit()
+
+
+    def _gui_destroy(self):
+        """Destroy created loading screen."""
+        self.signalClose.emit()
+
+
+    def _worker(self):
+        """Main cycle inner function of animation."""
+        self.isRunning = True
+        if self.importHook is not None:
+            self.importHook.install()
+
+        self._gui_create()
+
+        # first label set text
+        self._textCurrent = next(self._textGeneratorInstance)
+        self._labelTextSet(self._labelTextBase())
+
+        while not self.exit:
+            # sample progress for ETA
+            if self.textEtaFormat is not None:
+                progress = self.ui.drawPlace.progress
+                if progress is None:
+                    self.etaEstimator.reset()
+                else:
+                    self.etaEstimator.update(progress)
+
+            self._delayTimer += self._iterationDelay
+            if self._delayTimer > self.textUpdateDelay:
+                self._delayTimer = 0
+                # label set text (name of running phase or imported module has priority)
+                self._textCurrent = next(self._textGeneratorInstance)
+                self._labelTextSet(self._labelText(self._labelTextBase()))
+
+            if self.importHook is not None:
+                self._importProgressUpdate()
+            
+            # main animation
+            if not self.exit and self.ui.drawPlace.isVisible():
+                self.ui.drawPlace.signalMakeStep.emit()
+            
+            yield
+
+        else:
+            self._textGeneratorInstance.close()
+            self._phasesReportPrint()
+            if self.importHook is not None:
+                self._importProgressFinish()
+            self.isRunning = False
+            self._isWorkerFinished = True
+            self._gui_destroy()
+            return 0
+    
+
+    def worker(self):
+        """Entry cycle."""
+        worker = self._worker()
+        while True:
+            sleep(self._iterationDelay)
+
+            # check for self.worker.exit:
+            if '_exit' in self.worker.__dict__:
+                if self.worker.__dict__['_exit']:
+                    self.exit = True
+
+            # make next step
+            recorder = tracer.recorder
+            if recorder is not None:
+                recorder.begin("scheduler tick")
+            try:
+                next(worker)
+            except StopIteration as answer:
+                state = answer.value
+                break
+            finally:
+                if recorder is not None:
+                    recorder.end("scheduler tick")
+        
+        worker.close()
+        return state
+
+    
+    async def worker_async(self):
+        """Entry async cycle."""
+        worker = self._worker()
+        while True:
+            await asyncio.sleep(self._iterationDelay)
+
+            # check for self.worker.exit:
+            if '_exit' in self.worker_async.__dict__:
+                if self.worker_async.__dict__['_exit']:
+                    self.exit = True
+
+            # make next step
+            recorder = tracer.recorder
+            if recorder is not None:
+                recorder.begin("scheduler tick")
+            try:
+                next(worker)
+            except StopIteration as answer:
+                state = answer.value
+                break
+            finally:
+                if recorder is not None:
+                    recorder.end("scheduler tick")
+        
+        worker.close()
+        return state
\ No newline at end of file
@@ -0,0 +1,82 @@
+import os
+from time import perf_counter
+
+
+
+def isRemoteSession(environ: dict = None, platformName: str = None):
+    """ True if GUI is shown over remote session: SSH (X forwarding), remote X display, RDP or VNC platform of Qt.
+
+        environ - environment variables (default - os.environ), platformName - name of Qt platform plugin (if known).
+    """
+    if environ is None:
+        environ = os.environ
+    if any(environ.get(name) for name in ('SSH_CONNECTION', 'SSH_CLIENT', 'SSH_TTY', 'XRDP_SESSION')):
+        return True
+    if environ.get('SESSIONNAME', '').upper().startswith('RDP-'): # windows remote desktop
+        return True
+    # "host:0.0" - display of other host ("unix:0" and ":0" - local)
+    displayHost = environ.get('DISPLAY', '').rpartition(':')[0]
+    if displayHost and displayHost != 'unix':
+        return True
+    return platformName is not None and platformName.lower() == 'vnc'
+
+
+
+class DamageLimiter:
+    """ Limiter of repaints for low bandwidth links - token bucket of damaged pixels and min interval between repaints.
+
+        framesPerSecond / pixelsPerSecond - None means no limit. Bucket holds up to one second of pixels, repaint that is
+        larger than bucket is allowed when bucket is full. Also measures damaged pixels per second of allowed repaints
+        (pixelsPerSecondMeasured), with or without limits.
+    """
+    def __init__(self, framesPerSecond: float = None, pixelsPerSecond: float = None):
+        """INIT."""
+        self.framesPerSecond = framesPerSecond
+        self.pixelsPerSecond = pixelsPerSecond
+        self.pixelsPerSecondMeasured = 0.0
+        self.droppedCount = 0 # repaints, that were not allowed
+
+        self._tokens = pixelsPerSecond or 0.0
+        self._time = None
+        self._lastAllowedTime = None
+        self._measureStartTime = None
+        self._measurePixels = 0
+
+
+    def allow(self, pixelsCount: int, currentTime: float = None):
+        """Repaint of pixelsCount pixels - True if it is allowed now (then pixels are taken from bucket)."""
+        if currentTime is None:
+            currentTime = perf_counter()
+        if self._time is None:
+            self._time = self._measureStartTime = currentTime
+
+        if self.pixelsPerSecond is not None:
+            self._tokens = min(self.pixelsPerSecond, self._tokens + (currentTime - self._time) * self.pixelsPerSecond)
+        self._time = currentTime
+
+        isAllowed = True
+        if self.framesPerSecond is not None and self._lastAllowedTime is not None \
+                and currentTime - self._lastAllowedTime < 1 / self.framesPerSecond:
+            isAllowed = False
+        elif self.pixelsPerSecond is not None:
+            if pixelsCount > self._tokens and self._tokens < self.pixelsPerSecond:
+                isAllowed = False
+            else:
+                self._tokens -= pixelsCount
+
+        if isAllowed:
+            self._lastAllowedTime = currentTime
+        else:
+            self.droppedCount += 1
+        self._measure(pixelsCount if isAllowed else 0, currentTime)
+        return isAllowed
+
+
+    def _measure(self, pixelsCount: int, currentTime: float):
+        """Damaged pixels per second - by windows of one second."""
+        self._measurePixels += pixelsCount
+        elapsed = currentTime - self._measureStartTime
+        if elapsed >= 1:
+            self.pixelsPerSecondMeasured = self._measurePixels / elapsed
+            self._measurePixels = 0
+            self._measureStartTime = currentTime
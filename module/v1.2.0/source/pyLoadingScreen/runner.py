@@ -0,0 +1,225 @@
+import asyncio
+import functools
+from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5 import QtCore, QtWidgets
+
+
+
+class FuturesCounter:
+    """ Counts of completed futures (concurrent.futures.Future, asyncio.Future or Task) by done-callbacks.
+
+        Counters are updated under lock, so callbacks can be called from any threads.
+        Cost is O(1) per completed future, there is no polling of futures.
+        onUpdate(counter) - called on every completion, onDone(counter) - called once, when all futures are done.
+    """
+    def __init__(self, futures: object, onUpdate: object = None, onDone: object = None):
+        """INIT."""
+        self.futures = list(futures)
+        self.total = len(self.futures)
+        self.completed = 0
+        self.failed = 0
+        self._onUpdate = onUpdate
+        self._onDone = onDone
+        self._lock = Lock()
+
+        if not self.futures:
+            self._done()
+        for future in self.futures:
+            future.add_done_callback(self._futureDone)
+
+
+    @property
+    def isDone(self):
+        return self.completed == self.total
+
+
+    def _futureDone(self, future: object):
+        """Done-callback of future."""
+        isFailed = not future.cancelled() and future.exception() is not None
+        with self._lock:
+            if isFailed:
+                self.failed += 1
+            self.completed += 1
+            isDone = self.completed == self.total
+
+        # callbacks are called without lock - they can read counters
+        if self._onUpdate is not None:
+            self._onUpdate(self)
+        if isDone:
+            self._done()
+
+
+    def _done(self):
+        if self._onDone is not None:
+            self._onDone(self)
+
+
+    def results(self, returnExceptions: bool = False):
+        """Results of futures in input order. Exception of first failed future is raised, if not returnExceptions."""
+        results = []
+        for future in self.futures:
+            if returnExceptions and (future.cancelled() or future.exception() is not None):
+                results.append(future.exception() if not future.cancelled() else asyncio.CancelledError())
+            else:
+                results.append(future.result())
+        return results
+
+
+
+class LoadingScreenRunner:
+    """ Loading screen, that is shown while 'with' ('async with') block is running - see LoadingScreen.run.
+
+        'with' - animation worker is started in new thread, blocking functions are run in thread pool by 'call',
+            while GUI thread waits for them in local event loop (GUI is not blocked).
+        'async with' - animation worker is started as task of running asyncio loop (worker_async), coroutines are awaited
+            in block as usual.
+
+        Loading screen is closed right after block is finished (or raised), exception is not suppressed.
+        Must be used in GUI thread (as LoadingScreen is created).
+    """
+    def __init__(self, screenClass: type, screenParams: dict, executor: object = None):
+        """INIT."""
+        self._screenClass = screenClass
+        self._screenParams = screenParams
+        self._executor = executor
+        self._isExecutorOwn = executor is None
+
+        self.screen = None
+        self._thread = None
+        self._task = None
+
+
+    def _screenCreate(self):
+        """Create loading screen (and QApplication, if there is no instance yet)."""
+        self._app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.screen = self._screenClass(**self._screenParams)
+        return self.screen
+
+
+    def _screenClose(self):
+        """Close loading screen at once (runner is used in GUI thread), worker finishes at next step."""
+        self.screen._close()
+
+
+    def __enter__(self):
+        self._screenCreate()
+        self._thread = Thread(target=self.screen.worker, name="pyLoadingScreenWorker", daemon=True)
+        self._thread.start()
+        return self
+
+
+    def __exit__(self, excType: type, excValue: object, traceback: object):
+        self._screenClose()
+        if self._isExecutorOwn and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        return False
+
+
+    async def __aenter__(self):
+        self._screenCreate()
+        self._task = asyncio.ensure_future(self.screen.worker_async())
+        return self
+
+
+    async def __aexit__(self, excType: type, excValue: object, traceback: object):
+        self._screenClose()
+        await self._task
+        return False
+
+
+    def call(self, function: object, *args, **kwargs):
+        """ Run blocking function in thread pool and return its result (or raise its exception).
+
+            While function is running, GUI thread processes events in local event loop, so animation is played.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="pyLoadingScreenCall")
+        future = self._executor.submit(function, *args, **kwargs)
+
+        eventLoop = QtCore.QEventLoop()
+        future.add_done_callback(
+            lambda _: QtCore.QMetaObject.invokeMethod(eventLoop, "quit", QtCore.Qt.QueuedConnection)
+            )
+        if not future.done():
+            eventLoop.exec_()
+        return future.result()
+
+
+    def _futuresCounterStart(self, futures: object, onDone: object):
+        """Track futures by loading screen - progress and label are driven by count of completed futures."""
+        futuresCounter = FuturesCounter(futures, lambda counter: self.screen.setProgress(counter.completed / counter.total), onDone)
+        self.screen.futuresCounter = futuresCounter
+        if futuresCounter.total:
+            self.screen.setProgress(futuresCounter.completed / futuresCounter.total)
+        return futuresCounter
+
+
+    def wait(self, futures: object, returnExceptions: bool = False):
+        """ Wait for all futures (concurrent.futures.Future), while GUI thread processes events in local event loop.
+
+            Returns results of futures in input order (see FuturesCounter.results).
+        """
+        eventLoop = QtCore.QEventLoop()
+        futuresCounter = self._futuresCounterStart(futures,
+            lambda _: QtCore.QMetaObject.invokeMethod(eventLoop, "quit", QtCore.Qt.QueuedConnection)
+            )
+        if not futuresCounter.isDone:
+            eventLoop.exec_()
+        return futuresCounter.results(returnExceptions)
+
+
+    async def wait_async(self, futures: object, returnExceptions: bool = False):
+        """ Wait for all futures (asyncio.Future, Task or concurrent.futures.Future) at running asyncio loop.
+
+            Returns results of futures in input order (see FuturesCounter.results).
+        """
+        loop = asyncio.get_running_loop()
+        isDone = loop.create_future()
+
+        def onDone(_):
+            loop.call_soon_threadsafe(lambda: isDone.done() or isDone.set_result(None))
+
+        futuresCounter = self._futuresCounterStart(futures, onDone)
+        await isDone
+        return futuresCounter.results(returnExceptions)
+
+
+    def setProgress(self, progress: float = None):
+        """LoadingScreen.setProgress"""
+        self.screen.setProgress(progress)
+
+
+    def phase(self, name: str):
+        """LoadingScreen.phase"""
+        return self.screen.phase(name)
+
+
+
+def loading_screen(**screenParams):
+    """ Decorator - function is run under loading screen, with LoadingScreen params.
+
+        Blocking function is run in thread pool (see LoadingScreenRunner.call), coroutine function - on running asyncio loop.
+        Return value and exception of function are passed through.
+        Example:
+        "@loading_screen(texts=['Reading', 'Reading.', 'Reading..', 'Reading...'])
+         def readDatabase(path):
+             ..."
+    """
+    from pyLoadingScreen.pyLoadingScreen import LoadingScreen
+
+    def decorator(function: object):
+        if asyncio.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def wrapper(*args, **kwargs):
+                async with LoadingScreen.run(**screenParams):
+                    return await function(*args, **kwargs)
+        else:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with LoadingScreen.run(**screenParams) as runner:
+                    return runner.call(function, *args, **kwargs)
+        return wrapper
+
+    return decorator
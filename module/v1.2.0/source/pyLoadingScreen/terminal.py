@@ -0,0 +1,296 @@
+import sys
+from time import sleep, perf_counter
+from threading import Thread
+
+from pyLoadingScreen import animations
+from pyLoadingScreen.animations import POINT_RECORD_SIZE, LINE_RECORD_SIZE, GRADIENT_LINEAR
+
+
+# braille character - 2x4 dots per cell, bit of dot by (x, y) in cell
+_BRAILLE_BASE = 0x2800
+_BRAILLE_BITS = ((0x01, 0x02, 0x04, 0x40), (0x08, 0x10, 0x20, 0x80))
+
+# dots (sub-cells) per character cell: (by x, by y)
+_DOTS_PER_CELL = {
+    'braille': (2, 4),
+    'halfblock': (1, 2)
+}
+
+
+
+class TerminalRenderer:
+    """ Rasterizer of animation frames (animations.FrameBuffer - same geometry, as LoadingScreen widget) to character grid.
+
+        mode - "braille" (2x4 dots per character, one color per character) or "halfblock" (upper half block character,
+        2 pixels per character with own colors). Colors are 24-bit ANSI. Frame is rendered to string with only changed
+        (since previous frame) cells, so output is small for slow links. Layout is built in pixels of LoadingScreen scale
+        (pixelsPerDot pixels per dot), so animation params have same meaning.
+    """
+    pixelsPerDot = 4
+
+    def __init__(self, columns: int = 40, rows: int = 12, mode: str = "braille", backgroundRGBColor: tuple = (0, 0, 0)):
+        """INIT."""
+        self.columns = columns
+        self.rows = rows
+        self.mode = mode.lower()
+        self.dotsX, self.dotsY = _DOTS_PER_CELL[self.mode]
+        self.width = columns * self.dotsX # dots
+        self.height = rows * self.dotsY
+        self.backgroundRGBColor = tuple(backgroundRGBColor)
+        self._cells = None # cells of previous frame
+
+
+    def layoutSize(self):
+        """Size of animation layout (pixels)."""
+        return self.width * self.pixelsPerDot, self.height * self.pixelsPerDot
+
+
+    def rasterize(self, frame: animations.FrameBuffer, color: tuple):
+        """Colors of dots of frame (None - background). color - color of records with default color (-1)."""
+        width, height = self.width, self.height
+        scale = 1 / self.pixelsPerDot
+        dots = [None] * (width * height)
+
+        points = frame.points
+        for idx in range(0, len(points), POINT_RECORD_SIZE):
+            x, y, r, g, b = points[idx:idx + 5]
+            dotX, dotY = int(x * scale), int(y * scale)
+            if 0 <= dotX < width and 0 <= dotY < height:
+                dots[dotY * width + dotX] = (int(r), int(g), int(b)) if r >= 0 else color
+
+        background = self.backgroundRGBColor
+        lines = frame.lines
+        for idx in range(0, len(lines), LINE_RECORD_SIZE):
+            x1, y1, x2, y2, r, g, b, _, gradientType, gradientReverse = lines[idx:idx + LINE_RECORD_SIZE]
+            lineColor = (int(r), int(g), int(b)) if r >= 0 else color
+            x1, y1, x2, y2 = x1 * scale, y1 * scale, x2 * scale, y2 * scale
+            stepsCount = max(1, int(max(abs(x2 - x1), abs(y2 - y1)) + 1))
+            for step in range(stepsCount + 1):
+                t = step / stepsCount
+                dotX, dotY = int(x1 + (x2 - x1) * t), int(y1 + (y2 - y1) * t)
+                if not (0 <= dotX < width and 0 <= dotY < height):
+                    continue
+                if gradientType == GRADIENT_LINEAR:
+                    # from line color to background color (as QLinearGradient of widget)
+                    fade = 1 - t if gradientReverse else t
+                    dots[dotY * width + dotX] = tuple(int(c + (cb - c) * fade) for c, cb in zip(lineColor, background))
+                else:
+                    dots[dotY * width + dotX] = lineColor
+        return dots
+
+
+    def cells(self, dots: list):
+        """Character cells of dots: (character, foreground color, background color), None color - default of terminal."""
+        width = self.width
+        cells = []
+        if self.mode == "braille":
+            for row in range(self.rows):
+                for column in range(self.columns):
+                    mask = 0
+                    cellColor = None
+                    for dx in range(2):
+                        bits = _BRAILLE_BITS[dx]
+                        for dy in range(4):
+                            dotColor = dots[(row * 4 + dy) * width + column * 2 + dx]
+                            if dotColor is not None:
+                                mask |= bits[dy]
+                                cellColor = dotColor
+                    cells.append((chr(_BRAILLE_BASE + mask), cellColor, None) if mask else (" ", None, None))
+        else:
+            for row in range(self.rows):
+                for column in range(self.columns):
+                    top = dots[row * 2 * width + column]
+                    bottom = dots[(row * 2 + 1) * width + column]
+                    if top is None and bottom is None:
+                        cells.append((" ", None, None))
+                    elif top is None:
+                        cells.append(("▄", bottom, None))
+                    else:
+                        cells.append(("▀", top, bottom))
+        return cells
+
+
+    def render(self, frame: animations.FrameBuffer, color: tuple):
+        """ ANSI output of frame - only cells, changed since previous frame (all cells at first frame).
+
+            Cursor is moved relative to saved position (top left cell of grid, see 'start').
+        """
+        cells = self.cells(self.rasterize(frame, color))
+        previousCells = self._cells
+        self._cells = cells
+
+        output = ["\x1b[0m"]
+        foreground = background = None
+        cursorIdx = None
+        columns = self.columns
+        for idx, cell in enumerate(cells):
+            if previousCells is not None and previousCells[idx] == cell:
+                continue
+            if cursorIdx != idx:
+                output.append(_cursorMove(*divmod(idx, columns)))
+            character, cellForeground, cellBackground = cell
+            if cellForeground != foreground:
+                output.append("\x1b[38;2;{};{};{}m".format(*cellForeground) if cellForeground is not None else "\x1b[39m")
+                foreground = cellForeground
+            if cellBackground != background:
+                output.append("\x1b[48;2;{};{};{}m".format(*cellBackground) if cellBackground is not None else "\x1b[49m")
+                background = cellBackground
+            output.append(character)
+            # cursor is at next cell, but not at next row
+            cursorIdx = idx + 1 if (idx + 1) % columns else None
+        output.append("\x1b[0m")
+        return "".join(output) if len(output) > 2 else ""
+
+
+    def start(self, extraRows: int = 0):
+        """Output to reserve rows of grid (and extraRows) below cursor and save position of top left cell; hide cursor."""
+        rowsCount = self.rows + extraRows
+        self._cells = None
+        return "\n" * rowsCount + "\x1b[{}A\r\x1b7\x1b[?25l".format(rowsCount)
+
+
+    def finish(self, extraRows: int = 0):
+        """Output to move cursor below grid (and extraRows) and show cursor."""
+        return "\x1b[0m\x1b8\x1b[{}B\r\x1b[?25h".format(self.rows + extraRows)
+
+
+
+def _cursorMove(row: int, column: int):
+    """Move cursor to cell, relative to saved position."""
+    return "\x1b8" + ("\x1b[{}B".format(row) if row else "") + ("\x1b[{}C".format(column) if column else "")
+
+
+
+class TerminalLoadingScreen:
+    """ Loading screen in terminal (CLI tools, SSH sessions) - without display and PyQt5.
+
+        Built-in and registered animations are rendered by TerminalRenderer, text of label is shown below animation.
+        Usage is same as of LoadingScreen: 'worker' in thread and 'exit' attribute, or 'with' block:
+        "with TerminalLoadingScreen(animationType="RibbonDance"):
+             work()"
+        Output is one buffered write per frame. If stream is not terminal (redirected) - nothing is drawn, if not forceTerminal.
+    """
+    def __init__(self,
+            texts = ['Loading', 'Loading.', 'Loading..', 'Loading...'],
+            textUpdateDelay = 0.75,
+            textRGBColor = (255, 255, 255),
+
+            columns = 40,
+            rows = 12,
+            mode = "braille",
+            stream = None,
+            forceTerminal = False,
+
+            animationType = "RoundRobin",
+            animationDetailСoefficient = 20,
+            animationRGBColor = (255, 0, 0),
+            animationColorRainbow = True,
+            animationColorRainbowStep = 2,
+            animationColorRainbowMinValues = (0, 0, 0),
+            animationColorRainbowMaxValues = (255, 255, 255),
+            animationScale = 0.95,
+            animationCountStepsPerRound = 1440,
+            framesPerSecond = 30,
+            ):
+        """INIT."""
+        self.texts = texts
+        self.textUpdateDelay = textUpdateDelay
+        self.textRGBColor = textRGBColor
+        self.stream = stream if stream is not None else sys.stdout
+        self.forceTerminal = forceTerminal
+        self.renderer = TerminalRenderer(columns, rows, mode)
+
+        self.animation = animations.getAnimation(animationType)
+        self.layout = self.animation.layout(*self.renderer.layoutSize(), dict(animations.DEFAULT_PARAMS,
+            detailСoefficient=animationDetailСoefficient,
+            color=animationRGBColor,
+            colorRainbow=animationColorRainbow,
+            colorRainbowStep=animationColorRainbowStep,
+            colorRainbowMinValues=animationColorRainbowMinValues,
+            colorRainbowMaxValues=animationColorRainbowMaxValues,
+            scale=animationScale,
+            countStepsPerRound=animationCountStepsPerRound
+            ))
+        self.color = tuple(animationRGBColor)
+        self.colorRainbow = animationColorRainbow
+        self._colorRainbowGeneratorInstance = animations.colorRainbowGenerator(
+            animationColorRainbowStep, animationColorRainbowMinValues, animationColorRainbowMaxValues)
+
+        self.progress = None
+        self.exit = False
+        self.isRunning = False
+        self._iterationDelay = 1 / framesPerSecond
+        self._thread = None
+
+
+    def setProgress(self, progress: float = None):
+        """Set progress of determinate mode (from 0 to 1), None - indeterminate mode. Can be called from any thread."""
+        self.progress = min(max(float(progress), 0.0), 1.0) if progress is not None else None
+
+
+    def _textLine(self, text: str):
+        """Output of label text, centered in row below animation."""
+        return "{}\x1b[38;2;{};{};{}m{}\x1b[0m".format(
+            _cursorMove(self.renderer.rows, 0), *self.textRGBColor, text[:self.renderer.columns].center(self.renderer.columns))
+
+
+    def _write(self, output: str):
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+
+
+    def worker(self):
+        """Main cycle - draw frames until 'exit'."""
+        isDrawing = self.forceTerminal or (hasattr(self.stream, 'isatty') and self.stream.isatty())
+        self.isRunning = True
+        if isDrawing:
+            self._write(self.renderer.start(extraRows=1))
+
+        phase = 0
+        textIdx = 0
+        textCurrent = None
+        textTime = frameTime = perf_counter()
+        try:
+            while not self.exit:
+                if isDrawing:
+                    frame = self.animation.frame(phase, self.layout)
+                    if self.progress is not None:
+                        frame = self.animation.progressFrame(frame, self.progress, self.layout)
+                    color = self.color if not self.colorRainbow else tuple(next(self._colorRainbowGeneratorInstance))
+                    output = self.renderer.render(frame, color)
+
+                    text = self.texts[textIdx % len(self.texts)] if self.texts else ""
+                    if text != textCurrent:
+                        output += self._textLine(text)
+                        textCurrent = text
+                    self._write(output) # one write per frame
+
+                # deadline of next frame - time of render and write is not added to delay
+                frameTime += self._iterationDelay
+                currentTime = perf_counter()
+                if frameTime > currentTime:
+                    sleep(frameTime - currentTime)
+                else:
+                    frameTime = currentTime # late - next frames are not drawn in burst to catch up
+                phase += 1
+                if frameTime - textTime > self.textUpdateDelay:
+                    textTime = frameTime
+                    textIdx += 1
+        finally:
+            if isDrawing:
+                self._write(self.renderer.finish(extraRows=1))
+            self.isRunning = False
+
+
+    def __enter__(self):
+        self.exit = False
+        self._thread = Thread(target=self.worker, name="pyLoadingScreenTerminal", daemon=True)
+        self._thread.start()
+        return self
+
+
+    def __exit__(self, excType: type, excValue: object, traceback: object):
+        self.exit = True
+        self._thread.join()
+        return False
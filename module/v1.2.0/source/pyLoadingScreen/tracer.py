@@ -0,0 +1,131 @@
+import os
+import json
+import threading
+from array import array
+from itertools import count
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+
+# current recorder, None - tracing is off (instrumented code checks only this attribute)
+recorder = None
+
+
+
+class TraceRecorder:
+    """ Recorder of begin / end / instant events to preallocated ring buffer (oldest events are overwritten).
+
+        Events are saved as Chrome trace-event JSON, that can be opened in Perfetto (ui.perfetto.dev) or chrome://tracing.
+        Recording is thread-safe: slot of ring buffer is taken by itertools.count (atomic 'next').
+    """
+    def __init__(self, capacity: int = 65536):
+        """INIT."""
+        self.capacity = capacity
+        self._times = array('q', bytes(8 * capacity))
+        self._threads = array('Q', bytes(8 * capacity))
+        self._names = [None] * capacity
+        self._phases = [None] * capacity
+        self._counter = count()
+        self._threadNames = {}
+        self._startTime = perf_counter_ns()
+
+
+    def _record(self, phase: str, name: str):
+        idx = next(self._counter) % self.capacity
+        self._times[idx] = perf_counter_ns()
+        thread = threading.get_ident()
+        if thread not in self._threadNames:
+            self._threadNames[thread] = threading.current_thread().name
+        self._threads[idx] = thread
+        self._names[idx] = name
+        self._phases[idx] = phase
+
+
+    def begin(self, name: str):
+        """Begin of event 'name' at current thread."""
+        self._record('B', name)
+
+
+    def end(self, name: str):
+        """End of event 'name' at current thread."""
+        self._record('E', name)
+
+
+    def instant(self, name: str):
+        """Instant event."""
+        self._record('i', name)
+
+
+    def events(self):
+        """Recorded events (time in ns, thread ident, phase, name), from oldest."""
+        # taken slot is marked as empty
+        recordedCount = next(self._counter)
+        self._phases[recordedCount % self.capacity] = None
+        firstIdx = max(0, recordedCount - self.capacity)
+        events = []
+        for eventIdx in range(firstIdx, recordedCount):
+            idx = eventIdx % self.capacity
+            if self._phases[idx] is not None:
+                events.append((self._times[idx], self._threads[idx], self._phases[idx], self._names[idx]))
+        return events
+
+
+    def save(self, fileName: str):
+        """Save events as Chrome trace-event JSON. Returns count of saved events."""
+        processId = os.getpid()
+        threadIds = {}
+        openedEvents = {}
+
+        traceEvents = []
+        for time, thread, phase, name in self.events():
+            threadId = threadIds.setdefault(thread, len(threadIds) + 1)
+            # end of event, which begin is overwritten in ring buffer - skipped
+            if phase == 'E':
+                if not openedEvents.get(thread):
+                    continue
+                openedEvents[thread] -= 1
+            elif phase == 'B':
+                openedEvents[thread] = openedEvents.get(thread, 0) + 1
+
+            event = {'name': name, 'ph': phase, 'ts': (time - self._startTime) / 1000, 'pid': processId, 'tid': threadId}
+            if phase == 'i':
+                event['s'] = 't'
+            traceEvents.append(event)
+
+        for thread, threadId in threadIds.items():
+            traceEvents.append({'name': 'thread_name', 'ph': 'M', 'pid': processId, 'tid': threadId,
+                'args': {'name': self._threadNames.get(thread, 'Thread-{}'.format(threadId))}})
+
+        with open(fileName, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': traceEvents, 'displayTimeUnit': 'ms'}, file)
+        return len(traceEvents)
+
+
+
+def start(capacity: int = 65536):
+    """Start tracing to new recorder."""
+    global recorder
+    recorder = TraceRecorder(capacity)
+    return recorder
+
+
+def stop():
+    """Stop tracing. Returns recorder with recorded events (or None, if tracing was off)."""
+    global recorder
+    stoppedRecorder = recorder
+    recorder = None
+    return stoppedRecorder
+
+
+@contextmanager
+def span(name: str):
+    """Event of user-defined loading phase: "with tracer.span('load textures'): ..." """
+    currentRecorder = recorder
+    if currentRecorder is None:
+        yield
+        return
+    currentRecorder.begin(name)
+    try:
+        yield
+    finally:
+        currentRecorder.end(name)
@@ -0,0 +1,8 @@
+@echo off
+
+python setup.py sdist bdist_wheel
+twine upload dist/*
+
+echo.
+echo.
+pause
\ No newline at end of file
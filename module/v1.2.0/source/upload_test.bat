@@ -0,0 +1,8 @@
+@echo off
+
+python setup.py sdist bdist_wheel
+twine upload --repository-url https://test.pypi.org/legacy/ dist/*
+
+echo.
+echo.
+pause
\ No newline at end of file